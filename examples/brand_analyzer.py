@@ -6,33 +6,39 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import numpy as np
 from diverging_palette_generator import DivergingPaletteGenerator
+from analysis_functions import batch_hex_to_cam02ucs
+
+# Shared generator reused across analyses
+_GENERATOR = DivergingPaletteGenerator()
 
 def analyze_brand_colors(left_brand, right_brand):
     """
     Analyze brand colors and suggest optimal parameters where brand colors 
     appear in the MID-RANGE of each arm, not as endpoints.
     """
-    generator = DivergingPaletteGenerator()
+    # Collect the report and write it in one go instead of ~40 separate prints
+    out = []
     
-    print("=== Brand Color Analysis ===")
-    print(f"Left brand color: {left_brand}")
-    print(f"Right brand color: {right_brand}")
-    print()
+    out.append("=== Brand Color Analysis ===")
+    out.append(f"Left brand color: {left_brand}")
+    out.append(f"Right brand color: {right_brand}")
+    out.append("")
     
     # Extract HCL values
-    h1_brand, c1_brand, l1_brand = generator.hex_to_hcl(left_brand)
-    h3_brand, c3_brand, l3_brand = generator.hex_to_hcl(right_brand)
+    h1_brand, c1_brand, l1_brand = _GENERATOR.hex_to_hcl(left_brand)
+    h3_brand, c3_brand, l3_brand = _GENERATOR.hex_to_hcl(right_brand)
     
-    print("HCL Analysis:")
-    print(f"  Left brand:  H={h1_brand:.1f}°, C={c1_brand:.1f}, L={l1_brand:.1f}")
-    print(f"  Right brand: H={h3_brand:.1f}°, C={c3_brand:.1f}, L={l3_brand:.1f}")
-    print()
+    out.append("HCL Analysis:")
+    out.append(f"  Left brand:  H={h1_brand:.1f}°, C={c1_brand:.1f}, L={l1_brand:.1f}")
+    out.append(f"  Right brand: H={h3_brand:.1f}°, C={c3_brand:.1f}, L={l3_brand:.1f}")
+    out.append("")
     
-    print("🎯 KEY INSIGHT:")
-    print("Brand colors should appear in the MIDDLE of each arm, not as endpoints!")
-    print(f"Brand lightness values ({l1_brand:.0f}, {l3_brand:.0f}) are too high for darkest colors.")
-    print()
+    out.append("🎯 KEY INSIGHT:")
+    out.append("Brand colors should appear in the MIDDLE of each arm, not as endpoints!")
+    out.append(f"Brand lightness values ({l1_brand:.0f}, {l3_brand:.0f}) are too high for darkest colors.")
+    out.append("")
     
     # Calculate proper endpoint parameters
     # For brand colors to appear in mid-range, endpoints should be darker
@@ -47,40 +53,40 @@ def analyze_brand_colors(left_brand, right_brand):
     # Use slightly higher chroma at endpoints to ensure brand colors are achievable
     suggested_cmax = max(c1_brand, c3_brand) * 1.2  # 20% higher than brand chroma
     
-    print("=== RECOMMENDED UI SETTINGS ===")
-    print("🎛️ Set these values in your UI:")
-    print()
-    print("Hue Settings:")
-    print(f"  Left hue: {h1_brand:.0f}° (matches left brand)")
-    print(f"  Right hue: {h3_brand:.0f}° (matches right brand)")
-    print()
-    print("Lightness Settings:")
-    print(f"  Left lightness: {suggested_l1:.0f} (DARKER than brand - creates range)")
-    print(f"  Middle lightness: {suggested_l2:.0f} (light center)")
-    print(f"  Right lightness: {suggested_l3:.0f} (DARKER than brand - creates range)")
-    print()
-    print("Chroma Settings:")
-    print(f"  Left chroma: {suggested_cmax:.0f} (higher than brand to ensure coverage)")
-    print(f"  Right chroma: {suggested_cmax:.0f} (higher than brand to ensure coverage)")
-    print(f"  Left chroma peak: {suggested_cmax:.0f}")
-    print(f"  Right chroma peak: {suggested_cmax:.0f}")
-    print()
-    print("Power Settings:")
-    print(f"  Left lightness power: 1.0 (linear for now)")
-    print(f"  Right lightness power: 1.0 (linear for now)")
-    print()
-    print("Other Settings:")
-    print("  ✅ Check 'Classic diverging (HCL Wizard style)'")
-    print("  ✅ Check 'Use neutral center'")
-    print()
-    
-    print("💡 THEORY:")
-    print("With these settings, your brand colors should appear somewhere")
-    print("in the middle of each arm where their lightness values naturally fall.")
-    print()
+    out.append("=== RECOMMENDED UI SETTINGS ===")
+    out.append("🎛️ Set these values in your UI:")
+    out.append("")
+    out.append("Hue Settings:")
+    out.append(f"  Left hue: {h1_brand:.0f}° (matches left brand)")
+    out.append(f"  Right hue: {h3_brand:.0f}° (matches right brand)")
+    out.append("")
+    out.append("Lightness Settings:")
+    out.append(f"  Left lightness: {suggested_l1:.0f} (DARKER than brand - creates range)")
+    out.append(f"  Middle lightness: {suggested_l2:.0f} (light center)")
+    out.append(f"  Right lightness: {suggested_l3:.0f} (DARKER than brand - creates range)")
+    out.append("")
+    out.append("Chroma Settings:")
+    out.append(f"  Left chroma: {suggested_cmax:.0f} (higher than brand to ensure coverage)")
+    out.append(f"  Right chroma: {suggested_cmax:.0f} (higher than brand to ensure coverage)")
+    out.append(f"  Left chroma peak: {suggested_cmax:.0f}")
+    out.append(f"  Right chroma peak: {suggested_cmax:.0f}")
+    out.append("")
+    out.append("Power Settings:")
+    out.append(f"  Left lightness power: 1.0 (linear for now)")
+    out.append(f"  Right lightness power: 1.0 (linear for now)")
+    out.append("")
+    out.append("Other Settings:")
+    out.append("  ✅ Check 'Classic diverging (HCL Wizard style)'")
+    out.append("  ✅ Check 'Use neutral center'")
+    out.append("")
+    
+    out.append("💡 THEORY:")
+    out.append("With these settings, your brand colors should appear somewhere")
+    out.append("in the middle of each arm where their lightness values naturally fall.")
+    out.append("")
     
     # Generate test palette with these settings
-    test_palette = generator.generate_palette(
+    test_palette = _GENERATOR.generate_palette(
         n=21,  # More colors to see brand placement better
         h1=h1_brand, h3=h3_brand,
         c1=suggested_cmax, c3=suggested_cmax,
@@ -91,50 +97,42 @@ def analyze_brand_colors(left_brand, right_brand):
         output_format='hex'
     )
     
-    print("=== TEST PALETTE ===")
-    print("Generated palette with suggested settings:")
+    out.append("=== TEST PALETTE ===")
+    out.append("Generated palette with suggested settings:")
     for i, color in enumerate(test_palette):
-        print(f"  {i}: {color}")
-    print()
+        out.append(f"  {i}: {color}")
+    out.append("")
     
     # Test proximity
-    from analysis_functions import hex_to_rgb
-    from colorspacious import cspace_convert
-    import numpy as np
-    
-    def color_distance(hex1, hex2):
-        """Calculate CAM02-UCS distance between two hex colors"""
-        rgb1 = hex_to_rgb(hex1)
-        rgb2 = hex_to_rgb(hex2)
-        cam1 = cspace_convert(rgb1, "sRGB1", "CAM02-UCS")
-        cam2 = cspace_convert(rgb2, "sRGB1", "CAM02-UCS")
-        return np.linalg.norm(np.array(cam2) - np.array(cam1))
+    # Convert the palette and brand colors to CAM02-UCS once instead of per comparison
+    pal_cam = batch_hex_to_cam02ucs(test_palette)
+    brands = [(left_brand, "Left"), (right_brand, "Right")]
+    brand_cams = batch_hex_to_cam02ucs([brand_color for brand_color, _ in brands])
+    
+    # Distance from each brand color to every palette color in one shot
+    distances = np.linalg.norm(brand_cams[:, None, :] - pal_cam[None, :, :], axis=-1)
+    closest_indices = distances.argmin(axis=1)
     
     # Find closest matches
-    print("=== BRAND COLOR PROXIMITY ===")
-    for brand_color, brand_name in [(left_brand, "Left"), (right_brand, "Right")]:
-        min_distance = float('inf')
-        closest_idx = -1
-        closest_color = ""
+    out.append("=== BRAND COLOR PROXIMITY ===")
+    for i, (brand_color, brand_name) in enumerate(brands):
+        closest_idx = int(closest_indices[i])
+        min_distance = float(distances[i, closest_idx])
+        closest_color = test_palette[closest_idx]
         
-        for i, pal_color in enumerate(test_palette):
-            distance = color_distance(brand_color, pal_color)
-            if distance < min_distance:
-                min_distance = distance
-                closest_idx = i
-                closest_color = pal_color
-        
-        print(f"{brand_name} brand ({brand_color}):")
-        print(f"  Closest: {closest_color} at index {closest_idx}")
-        print(f"  ΔE distance: {min_distance:.1f}")
+        out.append(f"{brand_name} brand ({brand_color}):")
+        out.append(f"  Closest: {closest_color} at index {closest_idx}")
+        out.append(f"  ΔE distance: {min_distance:.1f}")
         
         if min_distance < 10:
-            print("  ✅ Very close match!")
+            out.append("  ✅ Very close match!")
         elif min_distance < 20:
-            print("  ✅ Good match")
+            out.append("  ✅ Good match")
         else:
-            print("  ⚠️ Could be closer - try adjusting chroma/lightness")
-        print()
+            out.append("  ⚠️ Could be closer - try adjusting chroma/lightness")
+        out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     # Example with common brand colors
@@ -6,6 +6,8 @@ ColorBrewer-style palettes with power transformation controls and brand color
 proximity testing.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from diverging_palette_generator import (
     DivergingPaletteGenerator,
     BrandColorProximityTester,
@@ -23,6 +25,10 @@ EXAMPLE_BRAND_COLORS = [
     "#7C3AED",  # Brand purple
 ]
 
+# Shared instances reused by all examples
+_GENERATOR = DivergingPaletteGenerator()
+_ANALYZER = PaletteCurveAnalyzer()
+
 def example_basic_usage():
     """Basic palette generation with default ColorBrewer-style settings."""
     print("=== Basic ColorBrewer-style Palette ===")
@@ -46,9 +52,7 @@ def example_advanced_palette():
     """Advanced palette generation with custom power transformations."""
     print("\n=== Advanced Palette with Custom Parameters ===")
     
-    generator = DivergingPaletteGenerator()
-    
-    palette = generator.generate_palette(
+    palette = _GENERATOR.generate_palette(
         n=199,  # Full 199-color palette
         h1=255,  # Left hue (blue)
         h3=10,   # Right hue (red)
@@ -114,8 +118,6 @@ def example_parameter_exploration():
     """Explore different parameter combinations."""
     print("\n=== Parameter Exploration ===")
     
-    generator = DivergingPaletteGenerator()
-    
     # Test different power transformations
     power_combinations = [
         (0.5, "Very narrow hat"),
@@ -125,18 +127,27 @@ def example_parameter_exploration():
         (2.0, "Very wide hat")
     ]
     
-    for power, description in power_combinations:
-        palette = generator.generate_palette(
+    # Generate every palette first
+    palettes = [
+        _GENERATOR.generate_palette(
             n=21,  # Small palette for quick demo
             p2=power,  # Left lightness power
             p4=power,  # Right lightness power
             output_format="hex"
         )
-        
-        # Quick analysis without plots
-        analyzer = PaletteCurveAnalyzer()
-        results = analyzer.analyze_palette_curves(palette, "hex", show_plot=False)
-        
+        for power, _ in power_combinations
+    ]
+    
+    # Quick analysis without plots, one palette per worker thread
+    # (the NumPy color conversions release the GIL; plotting shares one
+    # figure and must stay off in threads)
+    with ThreadPoolExecutor() as executor:
+        all_results = list(executor.map(
+            lambda palette: _ANALYZER.analyze_palette_curves(palette, "hex", show_plot=False),
+            palettes
+        ))
+    
+    for (power, description), results in zip(power_combinations, all_results):
         print(f"Power {power:3.1f} ({description}):")
         print(f"  Hat width ratio: {results['hat_width_ratio']:.3f}")
         print(f"  Peak at index: {results['peak_lightness_index']} (center: {results['midpoint_index']})")
@@ -155,8 +166,7 @@ def example_export_for_colab():
     )
     
     # Also get as RGB strings for compatibility with existing functions
-    generator = DivergingPaletteGenerator()
-    palette_rgb_strings = generator.generate_palette(
+    palette_rgb_strings = _GENERATOR.generate_palette(
         n=199,
         h1=220,
         h3=350,
@@ -0,0 +1,81 @@
+"""
+Color string parsing shared by the palette generator and the analysis functions
+
+The hex decoding kernels are compiled with numba when it is installed;
+otherwise the NumPy lookup-table versions below are used.
+"""
+
+import io
+import re
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Maps ASCII hex digits ('0'-'9', 'a'-'f', 'A'-'F') to their nibble values
+HEX_LUT = np.zeros(256, dtype=np.uint8)
+HEX_LUT[ord('0'):ord('9') + 1] = range(10)
+HEX_LUT[ord('a'):ord('f') + 1] = range(10, 16)
+HEX_LUT[ord('A'):ord('F') + 1] = range(10, 16)
+
+# ASCII codes of valid hex digits
+HEX_ASCII = np.frombuffer(b"0123456789abcdefABCDEF", dtype=np.uint8)
+
+# Matches CSS-style 'rgb(r, g, b)' strings
+RGB_RE = re.compile(rb"rgb\((\d+),\s*(\d+),\s*(\d+)\)")
+_RGB_DTYPE = [('r', 'i4'), ('g', 'i4'), ('b', 'i4')]
+
+
+def hex_bytes(colors):
+    """View a list of hex colors as an (N, 6) uint8 array of their ASCII digits.
+
+    Raises ValueError if any color is not exactly six hex digits (with optional '#').
+    """
+    digits = [c.lstrip('#') for c in colors]
+    for color, d in zip(colors, digits):
+        if len(d) != 6:
+            raise ValueError(f"Invalid hex color: {color!r}")
+    buf = np.frombuffer(''.join(digits).encode('ascii', 'replace'), dtype=np.uint8).reshape(-1, 6)
+    bad = np.flatnonzero(~np.isin(buf, HEX_ASCII).all(axis=1))
+    if len(bad):
+        raise ValueError(f"Invalid hex color: {colors[bad[0]]!r}")
+    return buf
+
+
+def rgb_strings_to_ints(rgb_list):
+    """Parse 'rgb(r, g, b)' strings into an (N, 3) int array; non-matching strings are skipped."""
+    blob = io.BytesIO('\n'.join(rgb_list).encode('ascii', 'replace'))
+    return np.fromregex(blob, RGB_RE, dtype=_RGB_DTYPE).view('i4').reshape(-1, 3)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def hex_bytes_to_rgb(buf):
+        """Decode an (N, 6) uint8 array of ASCII hex digits into (N, 3) uint8 RGB."""
+        out = np.empty((buf.shape[0], 3), dtype=np.uint8)
+        for i in range(buf.shape[0]):
+            for k in range(3):
+                out[i, k] = (HEX_LUT[buf[i, 2*k]] << 4) | HEX_LUT[buf[i, 2*k + 1]]
+        return out
+
+    @njit(cache=True)
+    def hex_bytes_to_rgb_floats(buf):
+        """Decode an (N, 6) uint8 array of ASCII hex digits into (N, 3) RGB floats in [0..1]."""
+        out = np.empty((buf.shape[0], 3), dtype=np.float64)
+        for i in range(buf.shape[0]):
+            for k in range(3):
+                out[i, k] = ((HEX_LUT[buf[i, 2*k]] << 4) | HEX_LUT[buf[i, 2*k + 1]]) / 255.0
+        return out
+else:
+    def hex_bytes_to_rgb(buf):
+        """Decode an (N, 6) uint8 array of ASCII hex digits into (N, 3) uint8 RGB."""
+        nib = HEX_LUT[buf]
+        return (nib[:, 0::2] << 4) | nib[:, 1::2]
+
+    def hex_bytes_to_rgb_floats(buf):
+        """Decode an (N, 6) uint8 array of ASCII hex digits into (N, 3) RGB floats in [0..1]."""
+        return hex_bytes_to_rgb(buf) / 255.0
@@ -3,87 +3,157 @@ Color analysis functions extracted from existing-functions.md
 These work with the existing analysis pipeline
 """
 
-import re
+from functools import lru_cache
 import numpy as np
 import math
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-from colorspacious import cspace_convert
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Importable both as src.analysis_functions and with src/ on sys.path
+try:
+    from ._format_impl import RGB_RE, hex_bytes, hex_bytes_to_rgb_floats, rgb_strings_to_ints
+except ImportError:
+    from _format_impl import RGB_RE, hex_bytes, hex_bytes_to_rgb_floats, rgb_strings_to_ints
+
+
+# colorspacious and matplotlib are imported on first use to keep
+# `import analysis_functions` cheap for short-lived scripts
+@lru_cache(maxsize=None)
+def _converter(start, end):
+    """
+    Returns a colorspacious conversion pipeline, resolved once per (start, end) pair.
+    'sRGB1' means sRGB with components in [0..1].
+    """
+    from colorspacious import cspace_converter
+    return cspace_converter(start, end)
 
 
 # Helper functions
+@lru_cache(maxsize=4096)
 def hex_to_rgb(hex_color):
     """
     Converts a hex string (e.g. '#4287f5') to an RGB tuple in [0..1].
     """
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = bytes.fromhex(hex_color.lstrip('#')[:6])
     return (r / 255.0, g / 255.0, b / 255.0)
 
+def hex_list_to_rgb(hex_list):
+    """
+    Converts a list of hex strings to an (N, 3) RGB array in [0..1].
+    All colors are parsed in one vectorized pass over their ASCII bytes.
+    Raises ValueError if any color is not exactly six hex digits.
+    """
+    if len(hex_list) == 0:
+        return np.empty((0, 3))
+    return hex_bytes_to_rgb_floats(hex_bytes(list(hex_list)))
+
+def rgb_strings_to_rgb(rgb_list):
+    """
+    Converts a list of 'rgb(r, g, b)' strings to an (N, 3) RGB array in [0..1].
+    Strings that don't match the pattern are skipped.
+    """
+    return rgb_strings_to_ints(rgb_list) / 255.0
+
+@lru_cache(maxsize=4096)
 def hex_to_cam02ucs(hex_color):
     """
     Converts a hex string to CAM02-UCS coordinates (J', a', b').
+    Results are cached, so the returned array is read-only.
     """
     rgb = hex_to_rgb(hex_color)
     # Convert from sRGB (normalized to [0..1]) to CAM02-UCS
-    # 'sRGB1' means sRGB with components in [0..1].
-    cam02ucs = cspace_convert(rgb, "sRGB1", "CAM02-UCS")
+    cam02ucs = _converter("sRGB1", "CAM02-UCS")(rgb)
+    cam02ucs.flags.writeable = False
     return cam02ucs
 
+def batch_hex_to_cam02ucs(hex_list):
+    """
+    Converts a list of hex strings to an (N, 3) float32 array of CAM02-UCS
+    coordinates with a single conversion call.
+    """
+    rgb_array = hex_list_to_rgb(hex_list).astype(np.float32)
+    # colorspacious works in float64 internally; float32 is plenty for ΔE
+    return _converter("sRGB1", "CAM02-UCS")(rgb_array).astype(np.float32)
+
+def rgb_array_to_cam02ucs(rgb_array):
+    """
+    Converts an (N, 3) RGB array in [0..1] to an (N, 3) float32 array of
+    CAM02-UCS coordinates.
+    """
+    return _converter("sRGB1", "CAM02-UCS")(np.asarray(rgb_array).reshape(-1, 3)).astype(np.float32)
+
 # Converting hex list to CAM02-UCS
 def convert_list_to_cam02ucs(color_list, color_type="hex"):
   """
-  Converts a list of hex or rgb colors to a list of CAM02-UCS coordinates.
+  Converts a list of hex or rgb colors to an (N, 3) float32 array of CAM02-UCS coordinates.
+  All colors are converted in a single conversion call.
   """
-  cam02ucs_list = []
   if color_type == "hex":
-      cam02ucs_list = [hex_to_cam02ucs(hx) for hx in color_list]
+      return batch_hex_to_cam02ucs(color_list)
   elif color_type == "rgb":
-    for rgb_str in color_list:
-      # Extract RGB values using regular expression
-      match = re.match(r"rgb\((\d+),\s*(\d+),\s*(\d+)\)", rgb_str)
-      if match:
-          r, g, b = map(int, match.groups())
-          # Normalize RGB values to [0..1]
-          rgb = (r / 255.0, g / 255.0, b / 255.0)
-          # Convert from sRGB to CAM02-UCS
-          cam02ucs = cspace_convert(rgb, "sRGB1", "CAM02-UCS")
-          cam02ucs_list.append(cam02ucs)
-      else:
+    rgb_array = rgb_strings_to_rgb(color_list)
+    if len(rgb_array) < len(color_list):
+      for rgb_str in color_list:
+        if not RGB_RE.match(rgb_str.encode('ascii', 'replace')):
           print(f"Warning: Invalid RGB string: {rgb_str}")  # Handle invalid strings
+  else:
+    rgb_array = np.empty((0, 3))
+
+  # Convert from sRGB to CAM02-UCS in one vectorized pass
+  return rgb_array_to_cam02ucs(rgb_array)
+
+# Below this many colors the compiled loop beats NumPy's per-call dispatch overhead
+_SMALL_PALETTE_SIZE = 64
 
-  return cam02ucs_list
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _adjacent_dE_small(arr):
+        """Compiled adjacent ΔE loop for small (N, 3) arrays."""
+        n = max(arr.shape[0] - 1, 0)
+        out = np.empty(n, dtype=arr.dtype)
+        for i in range(n):
+            dj = arr[i+1, 0] - arr[i, 0]
+            da = arr[i+1, 1] - arr[i, 1]
+            db = arr[i+1, 2] - arr[i, 2]
+            out[i] = math.sqrt(dj*dj + da*da + db*db)
+        return out
 
 def compute_adjacient_dE(cam02ucs_list):
     """
-    Given a list of (J', a', b') coordinates in CAM02-UCS,
+    Given a list or (N, 3) array of (J', a', b') coordinates in CAM02-UCS,
     compute the adjacent ΔE distances.
     """
-    diffs = []
-    for i in range(len(cam02ucs_list) - 1):
-        c1 = np.array(cam02ucs_list[i])
-        c2 = np.array(cam02ucs_list[i+1])
-        dE = np.linalg.norm(c2 - c1)  # Euclidean distance in J'a'b'
-        diffs.append(dE)
-    return diffs
+    arr = np.asarray(cam02ucs_list).reshape(-1, 3)
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(np.float64)
+    if NUMBA_AVAILABLE and len(arr) < _SMALL_PALETTE_SIZE:
+        return _adjacent_dE_small(np.ascontiguousarray(arr))
+    # Euclidean distance in J'a'b' between each neighbouring pair
+    return np.linalg.norm(np.diff(arr, axis=0), axis=1)
 
 # Get the deltas
-def get_delta_e(color_values, color_type="hex", show_series=False):
+def get_delta_e(color_values, color_type="hex", show_series=False, cam02ucs_colors=None):
     """
     Calculates and prints ΔE values for a list of hex or RGB colors.
+    Pass precomputed `cam02ucs_colors` to skip the color conversion.
     Returns dictionary with analysis results.
     """
-    cam02ucs_colors = convert_list_to_cam02ucs(color_values, color_type=color_type)
+    if cam02ucs_colors is None:
+        cam02ucs_colors = convert_list_to_cam02ucs(color_values, color_type=color_type)
 
     deltas = compute_adjacient_dE(cam02ucs_colors)
+    mean_dE = deltas.mean()
+    std_dE = deltas.std()
 
     results = {
         'deltas': deltas,
-        'mean_dE': np.mean(deltas),
-        'std_dE': np.std(deltas),
-        'cv': np.std(deltas)/np.mean(deltas),
+        'mean_dE': mean_dE,
+        'std_dE': std_dE,
+        'cv': std_dE / mean_dE,
         'cam02ucs_colors': cam02ucs_colors
     }
 
@@ -102,53 +172,51 @@ def get_delta_e(color_values, color_type="hex", show_series=False):
 
     return results
 
-def visualize_color_components(cam02ucs_colors, show_chroma_hue=True, return_data=False, use_lab_chroma=True):
+def get_color_components(cam02ucs_colors, use_lab_chroma=True, rgb=None):
     """
-    Visualizes or returns lightness, chroma, hue data
+    Returns lightness, chroma, hue data without building any figure.
+    Pass the palette's (N, 3) `rgb` array in [0..1] to skip converting
+    CAM02-UCS back to sRGB for the CIELAB components.
     """
+    arr = np.asarray(cam02ucs_colors, dtype=np.float64).reshape(-1, 3)
+
     if use_lab_chroma:
         # Convert CAM02-UCS back to RGB, then to CIELAB for HCL-compatible chroma
-        L = []
-        C = []
-        H = []
-        
-        for cam_color in cam02ucs_colors:
-            # Convert CAM02-UCS back to RGB
-            rgb = cspace_convert(cam_color, "CAM02-UCS", "sRGB1")
-            # Convert RGB to CIELAB
-            lab = cspace_convert(rgb, "sRGB1", "CIELab")
-            
-            L.append(lab[0])  # L* lightness
-            chroma = np.sqrt(lab[1]**2 + lab[2]**2)  # C* chroma in CIELAB
-            hue = np.degrees(np.arctan2(lab[2], lab[1])) % 360  # h* hue in CIELAB
-            C.append(chroma)
-            H.append(hue)
-    else:
-        # Original CAM02-UCS chroma calculation
-        L = [color[0] for color in cam02ucs_colors]
-        a = [color[1] for color in cam02ucs_colors]
-        b = [color[2] for color in cam02ucs_colors]
-
-        C = [np.sqrt(x*x + y*y) for x, y in zip(a, b)]
-        H = [np.degrees(np.arctan2(y, x)) % 360 for x, y in zip(a, b)]
-    
+        if rgb is None:
+            rgb = _converter("CAM02-UCS", "sRGB1")(arr)
+        lab = _converter("sRGB1", "CIELab")(rgb)
+
+        # For LAB chroma, a and b are not directly available
+        return {
+            'lightness': lab[:, 0],  # L* lightness
+            'chroma': np.hypot(lab[:, 1], lab[:, 2]),  # C* chroma in CIELAB
+            'hue': np.degrees(np.arctan2(lab[:, 2], lab[:, 1])) % 360  # h* hue in CIELAB
+        }
+
+    # Original CAM02-UCS chroma calculation, including a and b components
+    a = arr[:, 1]
+    b = arr[:, 2]
+    return {
+        'lightness': arr[:, 0],
+        'chroma': np.hypot(a, b),
+        'hue': np.degrees(np.arctan2(b, a)) % 360,
+        'a': a,
+        'b': b
+    }
+
+def visualize_color_components(cam02ucs_colors, show_chroma_hue=True, return_data=False, use_lab_chroma=True, data=None):
+    """
+    Visualizes or returns lightness, chroma, hue data.
+    Pass `data` from get_color_components to plot without recomputing it.
+    """
+    if data is None:
+        data = get_color_components(cam02ucs_colors, use_lab_chroma=use_lab_chroma)
     if return_data:
-        if use_lab_chroma:
-            # For LAB chroma, a and b are not directly available
-            return {
-                'lightness': L,
-                'chroma': C,
-                'hue': H
-            }
-        else:
-            # For CAM02-UCS, include a and b components
-            return {
-                'lightness': L,
-                'chroma': C,
-                'hue': H,
-                'a': a,
-                'b': b
-            }
+        return data
+
+    L, C, H = data['lightness'], data['chroma'], data['hue']
+
+    import matplotlib.pyplot as plt
 
     if show_chroma_hue:
         fig, axes = plt.subplots(3, 1, figsize=(6, 10))
@@ -187,7 +255,7 @@ def create_color_bar_plot(color_list, color_type="hex", height=1):
     """
     Creates a color bar plot and returns the figure
     """
-    num_colors = len(color_list)
+    import matplotlib.pyplot as plt
 
     # Create figure with appropriate width
     fig, ax = plt.subplots(figsize=(10, height))
@@ -200,19 +268,14 @@ def create_color_bar_plot(color_list, color_type="hex", height=1):
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
 
-    # Convert colors to proper format
+    # Convert colors to an (N, 3) array in [0..1]
     if color_type == "rgb":
         # Parse RGB strings like 'rgb(0, 31, 63)'
-        def parse_rgb(rgb_str):
-            values = rgb_str.replace('rgb(', '').replace(')', '').split(',')
-            r, g, b = map(int, values)
-            return (r/255, g/255, b/255)  # Normalize to 0-1 range
-        color_list = [parse_rgb(c) for c in color_list]
-
-    # Create rectangles for each color
-    width = 1.0 / num_colors
-    for i, color in enumerate(color_list):
-        rect = plt.Rectangle((i * width, 0), width, 1, facecolor=color)
-        ax.add_patch(rect)
+        rgb_array = rgb_strings_to_rgb(color_list)
+    else:
+        rgb_array = hex_list_to_rgb(color_list)
+
+    # Draw all colors as a single image row instead of one patch per color
+    ax.imshow(rgb_array[np.newaxis, :, :], aspect='auto', extent=(0, 1, 0, 1), interpolation='nearest')
 
     return fig
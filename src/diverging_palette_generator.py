@@ -7,11 +7,17 @@ package with additional brand color proximity testing.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from colorspacious import cspace_convert
+from colorspacious import cspace_converter
 from typing import List, Tuple, Dict, Optional, Union
+from functools import lru_cache
 import warnings
 
+# Importable both as src.diverging_palette_generator and with src/ on sys.path
+try:
+    from ._format_impl import hex_bytes, hex_bytes_to_rgb, hex_bytes_to_rgb_floats, rgb_strings_to_ints
+except ImportError:
+    from _format_impl import hex_bytes, hex_bytes_to_rgb, hex_bytes_to_rgb_floats, rgb_strings_to_ints
+
 try:
     from colorspace import divergingx_hcl, diverging_hcl
     COLORSPACE_AVAILABLE = True
@@ -22,6 +28,128 @@ except ImportError:
         "Some functions will not work without this dependency."
     )
 
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Above this many brand/palette pairs a k-d tree beats the full distance matrix
+_KDTREE_MIN_PAIRS = 5000
+
+# Conversion pipelines are built once and reused for every palette
+_SRGB_TO_CAM = cspace_converter("sRGB1", "CAM02-UCS")
+_SRGB_TO_LAB = cspace_converter("sRGB1", "CIELab")
+
+
+def _hex_array_to_rgb(colors: List[str]) -> np.ndarray:
+    """Decode a list of hex colors into an (N, 3) uint8 RGB array in one pass."""
+    return hex_bytes_to_rgb(hex_bytes(colors))
+
+
+# Decimal renderings of every byte value, so rgb() strings need no int formatting
+_BYTE_STR = tuple(map(str, range(256)))
+
+
+def _format_output(colors: List[str], output_format: str) -> List:
+    """Convert a list of hex colors to the requested output format."""
+    if output_format == "hex":
+        return colors
+    elif output_format == "rgb":
+        # Convert hex to RGB tuples (0-1 range)
+        return [tuple(rgb) for rgb in hex_bytes_to_rgb_floats(hex_bytes(colors)).tolist()]
+    elif output_format == "rgb_strings":
+        # Convert hex to CSS-style rgb() strings
+        return ["rgb(" + _BYTE_STR[r] + ", " + _BYTE_STR[g] + ", " + _BYTE_STR[b] + ")"
+                for r, g, b in _hex_array_to_rgb(colors).tolist()]
+    else:
+        raise ValueError("output_format must be 'hex', 'rgb', or 'rgb_strings'")
+
+
+def _palette_to_cam02ucs(palette: List[str], palette_format: str = "hex") -> np.ndarray:
+    """Convert a whole palette to an (N, 3) array of CAM02-UCS coordinates in one call."""
+    if palette_format == "hex":
+        rgb = _hex_array_to_rgb(palette)
+    elif palette_format == "rgb_strings":
+        # One regex sweep over the joined palette instead of a match per color
+        rgb = rgb_strings_to_ints(palette)
+    else:
+        return np.empty((0, 3))
+    return _SRGB_TO_CAM(rgb.reshape(-1, 3) / 255.0)
+
+
+def _gen_classic(
+    n: int,
+    h1: float, h3: float,
+    l1: float, l2: float,
+    p2: float,
+    cmax: float,
+    fixup: bool
+) -> Tuple[str, ...]:
+    """Sample a classic diverging_hcl palette (constant hue arms, neutral center)."""
+    # Use classic diverging_hcl for HCL Wizard-style palettes
+    # This maintains constant hues on each arm with neutral center
+    palette = diverging_hcl(
+        h=[h1, h3],  # Just the two end hues
+        c=cmax,      # Use maximum chroma value (this is the peak chroma)
+        l=[l1, l2],  # End lightness and peak lightness
+        power=p2,    # Use lightness power transformation
+        fixup=fixup
+    )
+    return tuple(palette.colors(n))
+
+
+def _gen_flex(
+    n: int,
+    h1: float, h3: float, h2: Optional[float],
+    c1: float, c3: float, c2: Optional[float],
+    l1: float, l2: float, l3: float,
+    p1: float, p2: float, p3: float, p4: float,
+    cmax: float,
+    fixup: bool
+) -> Tuple[str, ...]:
+    """Sample a flexible divergingx_hcl palette (multi-hue, per-arm powers)."""
+    # For neutral midpoint, use a middle hue that's between the two ends
+    if h2 is None:
+        # Calculate a neutral hue between h1 and h3
+        h2 = (h1 + h3) / 2.0 if abs(h1 - h3) < 180 else ((h1 + h3 + 360) / 2.0) % 360
+
+    if c2 is None:
+        c2 = 0  # Neutral center has zero chroma
+
+    palette = divergingx_hcl(
+        h=[h1, h2, h3],
+        c=[c1, c2, c3],
+        l=[l1, l2, l3],
+        power=[p1, p2, p3, p4],
+        cmax=cmax,  # Python version uses single cmax
+        fixup=fixup
+    )
+    return tuple(palette.colors(n))
+
+
+@lru_cache(maxsize=256)
+def _generate_hex_tuple(
+    n: int,
+    h1: float, h3: float, h2: Optional[float],
+    c1: float, c3: float, c2: Optional[float],
+    l1: float, l2: float, l3: float,
+    p1: float, p2: float, p3: float, p4: float,
+    cmax1: float, cmax2: float,
+    fixup: bool,
+    use_classic: bool
+) -> Tuple[str, ...]:
+    """Build a diverging palette as hex strings, memoized on the full parameter tuple."""
+    if use_classic and h2 is None:
+        return _gen_classic(n, h1, h3, l1, l2, p2, max(cmax1, cmax2), fixup)
+    return _gen_flex(n, h1, h3, h2, c1, c3, c2, l1, l2, l3, p1, p2, p3, p4, max(cmax1, cmax2), fixup)
+
+
+@lru_cache(maxsize=64)
+def _simple_hex_tuple(n: int, palette_name: str) -> Tuple[str, ...]:
+    """Sample a preset diverging palette as hex strings, memoized on (n, palette_name)."""
+    return tuple(diverging_hcl(palette=palette_name).colors(n))
+
 
 class DivergingPaletteGenerator:
     """
@@ -45,11 +173,11 @@ class DivergingPaletteGenerator:
         b = int(hex_color[4:6], 16) / 255.0
         
         # Convert RGB to CIELAB
-        lab = cspace_convert([r, g, b], "sRGB1", "CIELab")
+        lab = _SRGB_TO_LAB([r, g, b])
         L, a, b_lab = lab
         
         # Convert LAB to HCL
-        C = np.sqrt(a**2 + b_lab**2)  # Chroma
+        C = np.hypot(a, b_lab)  # Chroma
         H = np.degrees(np.arctan2(b_lab, a)) % 360  # Hue
         
         return H, C, L
@@ -80,16 +208,11 @@ class DivergingPaletteGenerator:
         if len(brand_colors) > 7:
             raise ValueError("Maximum 7 brand colors supported")
         
-        # Convert brand colors to HCL coordinates
-        h_vals = []
-        c_vals = []
-        l_vals = []
-        
-        for color in brand_colors:
-            h, c, l = self.hex_to_hcl(color)
-            h_vals.append(h)
-            c_vals.append(c)
-            l_vals.append(l)
+        # Convert brand colors to HCL coordinates in one batch
+        lab = _SRGB_TO_LAB(_hex_array_to_rgb(brand_colors) / 255.0)
+        l_vals = lab[:, 0].tolist()
+        c_vals = np.hypot(lab[:, 1], lab[:, 2]).tolist()
+        h_vals = (np.degrees(np.arctan2(lab[:, 2], lab[:, 1])) % 360).tolist()
         
         # Handle power parameter
         if isinstance(power, (int, float)):
@@ -109,31 +232,7 @@ class DivergingPaletteGenerator:
         # Get colors
         colors = palette.colors(n)
         
-        # Convert to requested format
-        if output_format == "hex":
-            return colors
-        elif output_format == "rgb":
-            # Convert hex to RGB tuples (0-1 range)
-            rgb_list = []
-            for color in colors:
-                hex_color = color.lstrip('#')
-                r = int(hex_color[0:2], 16) / 255.0
-                g = int(hex_color[2:4], 16) / 255.0
-                b = int(hex_color[4:6], 16) / 255.0
-                rgb_list.append((r, g, b))
-            return rgb_list
-        elif output_format == "rgb_strings":
-            # Convert hex to CSS-style rgb() strings
-            rgb_strings = []
-            for color in colors:
-                hex_color = color.lstrip('#')
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                rgb_strings.append(f"rgb({r}, {g}, {b})")
-            return rgb_strings
-        else:
-            raise ValueError("output_format must be 'hex', 'rgb', or 'rgb_strings'")
+        return _format_output(colors, output_format)
     
     def generate_palette(
         self,
@@ -180,68 +279,12 @@ class DivergingPaletteGenerator:
             List of color values in specified format
         """
         
-        if use_classic_diverging and h2 is None:
-            # Use classic diverging_hcl for HCL Wizard-style palettes
-            # This maintains constant hues on each arm with neutral center
-            palette = diverging_hcl(
-                h=[h1, h3],  # Just the two end hues
-                c=max(cmax1, cmax2),  # Use maximum chroma value (this is the peak chroma)
-                l=[l1, l2],  # End lightness and peak lightness
-                power=p2,    # Use lightness power transformation
-                fixup=fixup
-            )
-        else:
-            # Use flexible divergingx_hcl for multi-hue palettes
-            # For neutral midpoint, use a middle hue that's between the two ends
-            if h2 is None:
-                # Calculate a neutral hue between h1 and h3
-                h2 = (h1 + h3) / 2.0 if abs(h1 - h3) < 180 else ((h1 + h3 + 360) / 2.0) % 360
-            
-            if c2 is None:
-                c2 = 0  # Neutral center has zero chroma
-                
-            h_vals = [h1, h2, h3]
-            c_vals = [c1, c2, c3]
-            l_vals = [l1, l2, l3]
-            power_vals = [p1, p2, p3, p4]
-            
-            # Create palette object
-            palette = divergingx_hcl(
-                h=h_vals,
-                c=c_vals, 
-                l=l_vals,
-                power=power_vals,
-                cmax=max(cmax1, cmax2),  # Python version uses single cmax
-                fixup=fixup
-            )
+        colors = list(_generate_hex_tuple(
+            n, h1, h3, h2, c1, c3, c2, l1, l2, l3, p1, p2, p3, p4,
+            cmax1, cmax2, fixup, use_classic_diverging
+        ))
         
-        # Get colors
-        colors = palette.colors(n)
-        
-        if output_format == "hex":
-            return colors
-        elif output_format == "rgb":
-            # Convert hex to RGB tuples (0-1 range)
-            rgb_list = []
-            for color in colors:
-                hex_color = color.lstrip('#')
-                r = int(hex_color[0:2], 16) / 255.0
-                g = int(hex_color[2:4], 16) / 255.0
-                b = int(hex_color[4:6], 16) / 255.0
-                rgb_list.append((r, g, b))
-            return rgb_list
-        elif output_format == "rgb_strings":
-            # Convert hex to CSS-style rgb() strings
-            rgb_strings = []
-            for color in colors:
-                hex_color = color.lstrip('#')
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                rgb_strings.append(f"rgb({r}, {g}, {b})")
-            return rgb_strings
-        else:
-            raise ValueError("output_format must be 'hex', 'rgb', or 'rgb_strings'")
+        return _format_output(colors, output_format)
     
     def generate_simple_palette(
         self,
@@ -260,33 +303,9 @@ class DivergingPaletteGenerator:
         Returns:
             List of color values in specified format
         """
-        palette = diverging_hcl(palette=palette_name)
-        colors = palette.colors(n)
+        colors = list(_simple_hex_tuple(n, palette_name))
         
-        if output_format == "hex":
-            return colors
-        elif output_format == "rgb":
-            # Convert hex to RGB tuples (0-1 range)
-            rgb_list = []
-            for color in colors:
-                hex_color = color.lstrip('#')
-                r = int(hex_color[0:2], 16) / 255.0
-                g = int(hex_color[2:4], 16) / 255.0
-                b = int(hex_color[4:6], 16) / 255.0
-                rgb_list.append((r, g, b))
-            return rgb_list
-        elif output_format == "rgb_strings":
-            # Convert hex to CSS-style rgb() strings
-            rgb_strings = []
-            for color in colors:
-                hex_color = color.lstrip('#')
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                rgb_strings.append(f"rgb({r}, {g}, {b})")
-            return rgb_strings
-        else:
-            raise ValueError("output_format must be 'hex', 'rgb', or 'rgb_strings'")
+        return _format_output(colors, output_format)
 
 
 class BrandColorProximityTester:
@@ -307,14 +326,15 @@ class BrandColorProximityTester:
     def hex_to_cam02ucs(hex_color: str) -> np.ndarray:
         """Convert hex string to CAM02-UCS coordinates."""
         rgb = BrandColorProximityTester.hex_to_rgb(hex_color)
-        return cspace_convert(rgb, "sRGB1", "CAM02-UCS")
+        return _SRGB_TO_CAM(rgb)
     
     def test_brand_proximity(
         self,
         palette: List[str],
         brand_colors: List[str],
         palette_format: str = "hex",
-        threshold: float = 10.0
+        threshold: float = 10.0,
+        palette_cam02ucs: Optional[np.ndarray] = None
     ) -> Dict:
         """
         Test proximity of palette colors to brand colors.
@@ -324,63 +344,66 @@ class BrandColorProximityTester:
             brand_colors: List of brand colors in hex format
             palette_format: Format of palette colors ("hex" or "rgb_strings")
             threshold: ΔE threshold for proximity warning
+            palette_cam02ucs: Optional precomputed (N, 3) CAM02-UCS coordinates of the palette
             
         Returns:
             Dictionary with proximity analysis results
         """
-        # Convert brand colors to CAM02-UCS
-        brand_cam02ucs = []
-        for brand_color in brand_colors:
-            brand_cam02ucs.append(self.hex_to_cam02ucs(brand_color))
-        
-        # Convert palette colors to CAM02-UCS
-        palette_cam02ucs = []
-        if palette_format == "hex":
-            for color in palette:
-                palette_cam02ucs.append(self.hex_to_cam02ucs(color))
-        elif palette_format == "rgb_strings":
-            import re
-            for color in palette:
-                match = re.match(r"rgb\((\d+),\s*(\d+),\s*(\d+)\)", color)
-                if match:
-                    r, g, b = map(int, match.groups())
-                    rgb = (r / 255.0, g / 255.0, b / 255.0)
-                    cam02ucs = cspace_convert(rgb, "sRGB1", "CAM02-UCS")
-                    palette_cam02ucs.append(cam02ucs)
-        
-        # Find closest palette color to each brand color
+        # Convert brand colors to CAM02-UCS in one batch
+        brand_cam02ucs = _palette_to_cam02ucs(brand_colors, "hex")
+        
+        # Convert palette colors to CAM02-UCS in one batch, unless the caller already did
+        if palette_cam02ucs is None:
+            palette_cam02ucs = _palette_to_cam02ucs(palette, palette_format)
+        else:
+            palette_cam02ucs = np.asarray(palette_cam02ucs).reshape(-1, 3)
+        
+        brand_cam32 = brand_cam02ucs.astype(np.float32, copy=False)
+        palette_cam32 = palette_cam02ucs.astype(np.float32, copy=False)
+        
+        if SCIPY_AVAILABLE and len(brand_colors) * len(palette_cam32) >= _KDTREE_MIN_PAIRS:
+            # Nearest palette color per brand color without building the (M, N) matrix
+            closest_distances, closest_indices = cKDTree(palette_cam32).query(brand_cam32, k=1)
+        else:
+            # (M, N) matrix of distances from every brand color to every palette color.
+            # float32 halves the memory traffic; ΔE rankings are unaffected at ~1e-7 error
+            diff = brand_cam32[:, None, :] - palette_cam32[None, :, :]
+            distances = np.sqrt((diff * diff).sum(axis=-1))
+            closest_indices = distances.argmin(axis=1)
+            closest_distances = distances[np.arange(len(brand_colors)), closest_indices]
+        
+        # Closest palette color to each brand color
+        indices = closest_indices.tolist()
+        closest = list(zip(
+            brand_colors,
+            [palette[i] for i in indices],
+            indices,
+            closest_distances.astype(np.float64).tolist()
+        ))
+        
         results = {
             "brand_colors": brand_colors,
-            "closest_matches": [],
-            "min_distances": [],
-            "proximity_warnings": []
-        }
-        
-        for i, (brand_color, brand_cam) in enumerate(zip(brand_colors, brand_cam02ucs)):
-            min_distance = float('inf')
-            closest_index = -1
-            
-            for j, palette_cam in enumerate(palette_cam02ucs):
-                distance = np.linalg.norm(np.array(palette_cam) - np.array(brand_cam))
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_index = j
-            
-            results["closest_matches"].append({
-                "brand_color": brand_color,
-                "closest_palette_color": palette[closest_index],
-                "palette_index": closest_index,
-                "distance": min_distance
-            })
-            results["min_distances"].append(min_distance)
-            
-            if min_distance < threshold:
-                results["proximity_warnings"].append({
+            "closest_matches": [
+                {
                     "brand_color": brand_color,
-                    "palette_color": palette[closest_index],
+                    "closest_palette_color": palette_color,
+                    "palette_index": closest_index,
+                    "distance": min_distance
+                }
+                for brand_color, palette_color, closest_index, min_distance in closest
+            ],
+            "min_distances": [min_distance for *_, min_distance in closest],
+            "proximity_warnings": [
+                {
+                    "brand_color": brand_color,
+                    "palette_color": palette_color,
                     "distance": min_distance,
                     "message": f"Brand color {brand_color} is very close (ΔE={min_distance:.2f}) to palette color at index {closest_index}"
-                })
+                }
+                for brand_color, palette_color, closest_index, min_distance in closest
+                if min_distance < threshold
+            ]
+        }
         
         return results
     
@@ -408,6 +431,10 @@ class PaletteCurveAnalyzer:
     Analyze lightness and chroma curves of diverging palettes.
     """
     
+    # Figure reused by _plot_curves across calls. This is shared, unsynchronized
+    # state: don't call analyze_palette_curves(show_plot=True) from several threads
+    _figure = None
+    
     @staticmethod
     def analyze_palette_curves(
         palette: List[str],
@@ -420,41 +447,28 @@ class PaletteCurveAnalyzer:
         Args:
             palette: List of palette colors
             palette_format: Format of palette colors ("hex" or "rgb_strings")
-            show_plot: Whether to display plots
+            show_plot: Whether to display plots. Plotting reuses one shared figure,
+                so don't pass True from concurrent threads
             
         Returns:
             Dictionary with curve analysis results
         """
-        # Convert to CAM02-UCS
-        cam02ucs_colors = []
-        if palette_format == "hex":
-            for color in palette:
-                rgb = BrandColorProximityTester.hex_to_rgb(color)
-                cam02ucs = cspace_convert(rgb, "sRGB1", "CAM02-UCS")
-                cam02ucs_colors.append(cam02ucs)
-        elif palette_format == "rgb_strings":
-            import re
-            for color in palette:
-                match = re.match(r"rgb\((\d+),\s*(\d+),\s*(\d+)\)", color)
-                if match:
-                    r, g, b = map(int, match.groups())
-                    rgb = (r / 255.0, g / 255.0, b / 255.0)
-                    cam02ucs = cspace_convert(rgb, "sRGB1", "CAM02-UCS")
-                    cam02ucs_colors.append(cam02ucs)
+        # Convert to CAM02-UCS in one batch
+        cam02ucs_colors = _palette_to_cam02ucs(palette, palette_format)
         
         # Extract J', a', b' components
-        J = [color[0] for color in cam02ucs_colors]
-        a = [color[1] for color in cam02ucs_colors]
-        b = [color[2] for color in cam02ucs_colors]
+        J = cam02ucs_colors[:, 0]
+        a = cam02ucs_colors[:, 1]
+        b = cam02ucs_colors[:, 2]
         
         # Calculate chroma and hue
-        C = [np.sqrt(x*x + y*y) for x, y in zip(a, b)]
-        H = [np.degrees(np.arctan2(y, x)) % 360 for x, y in zip(a, b)]
+        C = np.hypot(a, b)
+        H = np.degrees(np.arctan2(b, a)) % 360
         
         # Find midpoint and peak
         n = len(J)
         midpoint_idx = n // 2
-        peak_J_idx = np.argmax(J)
+        peak_J_idx = int(J.argmax())
         
         # Analyze curve properties
         results = {
@@ -463,11 +477,11 @@ class PaletteCurveAnalyzer:
             "hue": H,
             "midpoint_index": midpoint_idx,
             "peak_lightness_index": peak_J_idx,
-            "peak_lightness_value": J[peak_J_idx],
-            "lightness_range": max(J) - min(J),
-            "chroma_range": max(C) - min(C),
-            "left_arm_monotonic": all(J[i] <= J[i+1] for i in range(peak_J_idx)),
-            "right_arm_monotonic": all(J[i] >= J[i+1] for i in range(peak_J_idx, n-1)),
+            "peak_lightness_value": float(J[peak_J_idx]),
+            "lightness_range": float(np.ptp(J)),
+            "chroma_range": float(np.ptp(C)),
+            "left_arm_monotonic": bool(np.all(np.diff(J[:peak_J_idx + 1]) >= 0)),
+            "right_arm_monotonic": bool(np.all(np.diff(J[peak_J_idx:]) <= 0)),
             "hat_width_ratio": abs(peak_J_idx - midpoint_idx) / (n / 2)  # How far peak is from center
         }
         
@@ -477,39 +491,95 @@ class PaletteCurveAnalyzer:
         return results
     
     @staticmethod
-    def _plot_curves(J: List[float], C: List[float], H: List[float], results: Dict) -> None:
-        """Plot lightness, chroma, and hue curves."""
-        fig, axes = plt.subplots(3, 1, figsize=(10, 8))
-        x = range(len(J))
+    def _plot_curves(
+        J: List[float],
+        C: List[float],
+        H: List[float],
+        results: Dict,
+        fig=None
+    ):
+        """
+        Plot lightness, chroma, and hue curves.
+        
+        The three-axes figure is built once and reused; later calls only swap the
+        line data. Pass `fig` to update a specific figure from _new_curves_figure();
+        it is laid out but not shown, so displaying it is up to the caller.
+        The shared figure is class-level state, so this is not thread-safe.
+        """
+        # Imported here so that generating and analyzing palettes doesn't pay for matplotlib
+        import matplotlib.pyplot as plt
+        
+        shared = fig is None
+        if shared:
+            fig = PaletteCurveAnalyzer._figure
+            if fig is None or not plt.fignum_exists(fig.number):
+                fig = PaletteCurveAnalyzer._figure = PaletteCurveAnalyzer._new_curves_figure()
+        axes = fig.axes
+        x = np.arange(len(J))
+        peak = results["peak_lightness_index"]
+        mid = results["midpoint_index"]
         
         # Lightness plot
-        axes[0].plot(x, J, 'b-', linewidth=2)
-        axes[0].axvline(results["peak_lightness_index"], color='r', linestyle='--', alpha=0.7, label='Peak')
-        axes[0].axvline(results["midpoint_index"], color='g', linestyle='--', alpha=0.7, label='Midpoint')
+        curve, peak_line, mid_line = axes[0].lines
+        curve.set_data(x, J)
+        peak_line.set_xdata([peak, peak])
+        mid_line.set_xdata([mid, mid])
         axes[0].set_title(f"Lightness (J') - Range: {results['lightness_range']:.1f}")
-        axes[0].set_ylabel("J'")
-        axes[0].grid(True, alpha=0.3)
-        axes[0].legend()
         
         # Chroma plot
-        axes[1].plot(x, C, 'r-', linewidth=2)
-        axes[1].axvline(results["midpoint_index"], color='g', linestyle='--', alpha=0.7, label='Midpoint')
+        curve, mid_line = axes[1].lines
+        curve.set_data(x, C)
+        mid_line.set_xdata([mid, mid])
         axes[1].set_title(f"Chroma - Range: {results['chroma_range']:.1f}")
+        
+        # Hue plot
+        curve, mid_line = axes[2].lines
+        curve.set_data(x, H)
+        mid_line.set_xdata([mid, mid])
+        
+        for ax in axes:
+            ax.relim()
+            ax.autoscale_view()
+        
+        fig.tight_layout()
+        if shared:
+            plt.show()
+        return fig
+    
+    @staticmethod
+    def _new_curves_figure():
+        """Create the lightness/chroma/hue figure with empty curves and reference lines."""
+        import matplotlib.pyplot as plt
+        
+        fig, axes = plt.subplots(3, 1, figsize=(10, 8))
+        
+        # Lightness plot
+        axes[0].plot([], [], 'b-', linewidth=2)
+        axes[0].axvline(0, color='r', linestyle='--', alpha=0.7, label='Peak')
+        axes[0].axvline(0, color='g', linestyle='--', alpha=0.7, label='Midpoint')
+        axes[0].set_ylabel("J'")
+        
+        # Chroma plot
+        axes[1].plot([], [], 'r-', linewidth=2)
+        axes[1].axvline(0, color='g', linestyle='--', alpha=0.7, label='Midpoint')
         axes[1].set_ylabel("Chroma")
-        axes[1].grid(True, alpha=0.3)
-        axes[1].legend()
         
         # Hue plot
-        axes[2].plot(x, H, 'purple', linewidth=2)
-        axes[2].axvline(results["midpoint_index"], color='g', linestyle='--', alpha=0.7, label='Midpoint')
+        axes[2].plot([], [], 'purple', linewidth=2)
+        axes[2].axvline(0, color='g', linestyle='--', alpha=0.7, label='Midpoint')
         axes[2].set_title("Hue Angle")
         axes[2].set_ylabel("Hue (°)")
         axes[2].set_xlabel("Palette Index")
-        axes[2].grid(True, alpha=0.3)
-        axes[2].legend()
         
-        plt.tight_layout()
-        plt.show()
+        for ax in axes:
+            ax.grid(True, alpha=0.3)
+            ax.legend()
+        
+        return fig
+
+
+# Shared generator for the convenience functions below
+_DEFAULT_GENERATOR = DivergingPaletteGenerator() if COLORSPACE_AVAILABLE else None
 
 
 # Convenience functions for quick usage
@@ -535,7 +605,23 @@ def generate_colorbrewer_style_palette(
     Returns:
         List of colors in specified format
     """
-    generator = DivergingPaletteGenerator()
+    return list(_cached_colorbrewer_style_palette(
+        n, left_hue, right_hue, narrow_hat, output_format, use_classic_diverging
+    ))
+
+
+@lru_cache(maxsize=64)
+def _cached_colorbrewer_style_palette(
+    n: int,
+    left_hue: float,
+    right_hue: float,
+    narrow_hat: bool,
+    output_format: str,
+    use_classic_diverging: bool
+) -> Tuple:
+    """Memoized body of generate_colorbrewer_style_palette, keyed on its arguments."""
+    if _DEFAULT_GENERATOR is None:
+        raise ImportError("colorspace package is required. Install with: pip install colorspace")
     
     # ColorBrewer-style parameters for narrow hat and smooth curves
     if narrow_hat:
@@ -545,7 +631,7 @@ def generate_colorbrewer_style_palette(
         p2 = p4 = 1.2  # Wider lightness hat (Leonardo-style)
         cmax1 = cmax2 = 65  # Higher chroma peaks
     
-    return generator.generate_palette(
+    return tuple(_DEFAULT_GENERATOR.generate_palette(
         n=n,
         h1=left_hue,
         h3=right_hue,
@@ -555,7 +641,7 @@ def generate_colorbrewer_style_palette(
         cmax2=cmax2,
         output_format=output_format,
         use_classic_diverging=use_classic_diverging
-    )
+    ))
 
 
 def test_brand_proximity_quick(
@@ -0,0 +1,56 @@
+"""
+Tests for the vectorized helpers in analysis_functions
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+from analysis_functions import hex_to_rgb, hex_list_to_rgb, rgb_strings_to_rgb, compute_adjacient_dE, rgb_array_to_cam02ucs, get_color_components
+
+def test_hex_list_to_rgb_matches_hex_to_rgb():
+    """Batch hex parsing agrees with the single-color parser."""
+    colors = ['#002F70', '#f6f6f6', '#9F8eA8', 'FFFFFF', '#000000']
+
+    batch = hex_list_to_rgb(colors)
+
+    assert batch.shape == (5, 3)
+    assert np.allclose(batch, [hex_to_rgb(c) for c in colors])
+
+def test_hex_list_to_rgb_empty():
+    """An empty palette gives an empty (0, 3) array."""
+    assert hex_list_to_rgb([]).shape == (0, 3)
+
+def test_hex_list_to_rgb_rejects_malformed():
+    """Colors that aren't exactly six hex digits raise instead of being misparsed."""
+    for hex_list in (['#FFF', '#FFFFFFFFF'], ['#GG0000']):
+        with pytest.raises(ValueError):
+            hex_list_to_rgb(hex_list)
+
+def test_rgb_strings_to_rgb():
+    """CSS rgb() strings parse to [0..1] floats, skipping malformed entries."""
+    rgb = rgb_strings_to_rgb(['rgb(255, 0, 51)', 'not a color', 'rgb(0,102,255)'])
+
+    assert np.allclose(rgb, [(1.0, 0.0, 0.2), (0.0, 0.4, 1.0)])
+
+def test_compute_adjacient_dE():
+    """Adjacent ΔE is the Euclidean distance between neighbouring colors."""
+    coords = [(0, 0, 0), (3, 4, 0), (3, 4, 12)]
+
+    deltas = compute_adjacient_dE(coords)
+
+    assert np.allclose(deltas, [5.0, 12.0])
+    assert compute_adjacient_dE(coords[:1]).shape == (0,)
+
+def test_color_components_from_rgb_match_round_trip():
+    """Passing the sRGB array gives the same components as converting back from CAM02-UCS."""
+    rgb = hex_list_to_rgb(['#1e3a8a', '#f7f7f7', '#dc2626'])
+    cam02ucs = rgb_array_to_cam02ucs(rgb)
+
+    direct = get_color_components(cam02ucs, rgb=rgb)
+    round_trip = get_color_components(cam02ucs)
+
+    for key in ('lightness', 'chroma'):
+        assert np.allclose(direct[key], round_trip[key], atol=1e-3)
@@ -0,0 +1,55 @@
+"""
+Tests for the vectorized paths in diverging_palette_generator
+"""
+
+import sys
+import os
+import subprocess
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+from diverging_palette_generator import (
+    DivergingPaletteGenerator,
+    BrandColorProximityTester,
+    PaletteCurveAnalyzer,
+)
+
+def test_rgb_strings_match_hex():
+    generator = DivergingPaletteGenerator()
+    hex_palette = generator.generate_palette(n=11, output_format="hex")
+    rgb_strings = generator.generate_palette(n=11, output_format="rgb_strings")
+    expected = [f"rgb({int(c[1:3], 16)}, {int(c[3:5], 16)}, {int(c[5:7], 16)})" for c in hex_palette]
+    assert rgb_strings == expected
+
+def test_curve_analysis_same_for_hex_and_rgb_strings():
+    generator = DivergingPaletteGenerator()
+    hex_results = PaletteCurveAnalyzer.analyze_palette_curves(
+        generator.generate_palette(n=21, output_format="hex"), "hex", show_plot=False)
+    rgb_results = PaletteCurveAnalyzer.analyze_palette_curves(
+        generator.generate_palette(n=21, output_format="rgb_strings"), "rgb_strings", show_plot=False)
+    assert np.allclose(hex_results["lightness"], rgb_results["lightness"])
+    assert hex_results["peak_lightness_index"] == 10
+    assert hex_results["left_arm_monotonic"] and hex_results["right_arm_monotonic"]
+
+def test_brand_proximity_exact_match():
+    palette = DivergingPaletteGenerator().generate_palette(n=11, output_format="hex")
+    results = BrandColorProximityTester().test_brand_proximity(palette, [palette[3], "#00FF00"], threshold=5.0)
+    assert results["closest_matches"][0]["palette_index"] == 3
+    assert results["min_distances"][0] < 1e-6
+    assert len(results["proximity_warnings"]) == 1
+
+def test_brand_proximity_rejects_malformed_hex():
+    palette = DivergingPaletteGenerator().generate_palette(n=11, output_format="hex")
+    tester = BrandColorProximityTester()
+    for brand_colors in (["#FFF", "#FFFFFFFFF"], ["#GG0000"]):
+        with pytest.raises(ValueError):
+            tester.test_brand_proximity(palette, brand_colors)
+
+def test_importable_as_src_package():
+    """The README's `from src.diverging_palette_generator import ...` works without src/ on sys.path."""
+    root = os.path.join(os.path.dirname(__file__), '..')
+    result = subprocess.run(
+        [sys.executable, "-c", "from src.diverging_palette_generator import generate_colorbrewer_style_palette"],
+        cwd=root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,66 @@
+"""
+AppTest checks for the Streamlit palette builder
+"""
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(__file__), '..', 'ui', 'palette_builder.py')
+
+
+def run_app(**query):
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    for key, value in query.items():
+        at.query_params[key] = value
+    return at.run()
+
+
+def generate_button(at):
+    return next(b for b in at.button if "Generate" in str(b.label))
+
+
+def test_out_of_range_rgb_input_is_ignored():
+    """rgb() components above 255 are rejected instead of crashing the script."""
+    at = run_app()
+    next(t for t in at.text_input if t.label == "RGB input").set_value("rgb(300, 0, 0)")
+    at.checkbox(key="use_neutral_center").uncheck()
+    generate_button(at).click().run()
+    assert not at.exception
+    assert at.session_state.generated_palette is not None
+
+
+def test_restore_from_url_seeds_widgets():
+    """A shared link restores the palette and the sidebar widgets, and the next Generate keeps them."""
+    at = run_app(n="51", h1="100", p4="2.0", classic="0", middle="#cc8800")
+    assert not at.exception and not at.error
+    assert len(at.session_state.generated_palette) == 51
+    assert at.number_input(key="n_colors").value == 51
+    assert at.slider(key="h1_slider").value == 100
+    assert at.slider(key="p4").value == 2.0
+    assert not at.checkbox(key="use_neutral_center").value
+    assert not at.checkbox(key="use_classic_diverging").value
+    assert at.color_picker(key="middle_color").value == "#cc8800"
+    restored = at.session_state.generated_palette
+
+    generate_button(at).click().run()
+    assert at.session_state.generated_palette == restored
+
+
+def test_restore_from_url_clamps_to_widget_ranges():
+    """Out-of-range URL values generate with the same clamped values the widgets show."""
+    at = run_app(n="1001", p1="5", l2="250")
+    assert not at.exception
+    assert len(at.session_state.generated_palette) == 299
+    assert at.number_input(key="n_colors").value == 299
+    assert at.slider(key="p1").value == 3.0
+    assert at.slider(key="l2_slider").value == 100
+
+
+def test_restore_from_url_rejects_invalid_values():
+    """Malformed URL values show an error instead of crashing the script."""
+    for query in ({"n": "51", "middle": "zzz"}, {"n": "abc"}, {"n": "51", "h1": "nan"}):
+        at = run_app(**query)
+        assert not at.exception
+        assert at.error
+        assert at.session_state.generated_palette is None
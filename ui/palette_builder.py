@@ -7,14 +7,17 @@ real-time parameter adjustments and comprehensive analysis output.
 
 import sys
 import os
+import io
+import math
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
+# matplotlib and altair are imported where the charts are drawn, so the
+# first page load before any palette exists doesn't pay for them
 from diverging_palette_generator import DivergingPaletteGenerator, BrandColorProximityTester
-from analysis_functions import get_delta_e, visualize_color_components, create_color_bar_plot, convert_list_to_cam02ucs, compute_adjacient_dE
+from analysis_functions import get_delta_e, get_color_components, create_color_bar_plot, rgb_array_to_cam02ucs, rgb_strings_to_rgb
 import re
 
 # Set page config
@@ -33,103 +36,305 @@ if 'generated_palette' not in st.session_state:
     st.session_state.generated_palette = None
 
 # Initialize parameter values in session state for two-way binding
-def init_param(key, default_value):
+LINKED_PARAMS = {'h1': 255, 'h3': 10, 'l1': 20, 'l2': 97, 'l3': 20,
+                 'c1': 50, 'c3': 50, 'cmax1': 60, 'cmax2': 60}
+
+def init_param(name, default_value):
+    """Seed a parameter's shared value and its slider and number input widgets"""
+    for key in (f"{name}_value", f"{name}_slider", f"{name}_input"):
+        if key not in st.session_state:
+            st.session_state[key] = default_value
+
+for name, default_value in LINKED_PARAMS.items():
+    init_param(name, default_value)
+
+# Remaining keyed widgets start from session state too, so a shared URL can seed them
+WIDGET_DEFAULTS = {'n_colors': 199, 'p1': 1.3, 'p2': 1.3, 'p3': 1.3, 'p4': 1.3,
+                   'use_neutral_center': True, 'use_classic_diverging': True,
+                   'middle_color': '#808080'}
+
+for key, default_value in WIDGET_DEFAULTS.items():
     if key not in st.session_state:
         st.session_state[key] = default_value
 
-init_param('h1_value', 255)
-init_param('h3_value', 10)
-init_param('l1_value', 20)
-init_param('l2_value', 97)
-init_param('l3_value', 20)
-init_param('c1_value', 50)
-init_param('c3_value', 50)
-init_param('cmax1_value', 60)
-init_param('cmax2_value', 60)
+def sync_linked_params():
+    """Submit callback: copy whichever of each slider/number input pair changed to the other"""
+    for name in LINKED_PARAMS:
+        value = st.session_state[f"{name}_slider"]
+        if value == st.session_state[f"{name}_value"]:
+            value = st.session_state[f"{name}_input"]
+        st.session_state[f"{name}_value"] = value
+        st.session_state[f"{name}_slider"] = value
+        st.session_state[f"{name}_input"] = value
 
 # Helper functions
 def hex_to_rgb(hex_color):
     """Convert hex to RGB tuple (0-255 range)"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    return tuple(bytes.fromhex(hex_color.lstrip('#')[:6]))
 
 def rgb_to_hex(rgb_tuple):
     """Convert RGB tuple to hex string"""
-    return f"#{rgb_tuple[0]:02x}{rgb_tuple[1]:02x}{rgb_tuple[2]:02x}"
+    return "#" + bytes(rgb_tuple).hex()
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+def rgb_strings_to_hex(rgb_strings):
+    """Convert a list of rgb(r,g,b) strings to lowercase hex strings in one vectorized pass"""
+    rgb = np.rint(rgb_strings_to_rgb(rgb_strings) * 255).astype(np.uint8)
+    chars = np.empty((len(rgb), 7), dtype=np.uint8)
+    chars[:, 0] = ord('#')
+    chars[:, 1::2] = _HEX_DIGITS[rgb >> 4]
+    chars[:, 2::2] = _HEX_DIGITS[rgb & 0x0F]
+    return chars.view('S7').ravel().astype(str).tolist()
+
+@st.cache_data(show_spinner=False)
+def middle_hue(hex_color):
+    """CIELab hue angle in degrees of a hex color"""
+    from colorspacious import cspace_convert
+    lab = cspace_convert(np.frombuffer(bytes.fromhex(hex_color.lstrip('#')), dtype=np.uint8) / 255.0, "sRGB1", "CIELab")
+    return float(np.degrees(np.arctan2(lab[2], lab[1])) % 360)  # Hue from a*, b*
+
+def sample_lines(colors, start):
+    """Numbered lines for a run of palette colors starting at index `start`"""
+    return "\n".join(f"{i:3d}: {color}" for i, color in enumerate(colors, start))
+
+# Lenient 'rgb(r, g, b)' pattern for user-typed input
+_RGB_INPUT_RE = re.compile(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
 
 def parse_rgb_input(rgb_input):
-    """Parse rgb(r,g,b) string to RGB tuple"""
-    match = re.match(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', rgb_input.strip())
+    """Parse rgb(r,g,b) string to RGB tuple, or None if it is malformed or a component exceeds 255"""
+    match = _RGB_INPUT_RE.match(rgb_input.strip())
     if match:
-        return tuple(int(x) for x in match.groups())
+        rgb = tuple(int(x) for x in match.groups())
+        if max(rgb) <= 255:
+            return rgb
     return None
 
+def params_to_query(params, middle_color=None):
+    """Serialize generate_palette keyword arguments (and the middle color picked, if any) into URL query parameters"""
+    query = {key: str(value) for key, value in params.items()
+             if value is not None and key not in ("output_format", "use_classic_diverging")}
+    query["classic"] = "1" if params["use_classic_diverging"] else "0"
+    if middle_color is not None:
+        query["middle"] = middle_color
+    return query
+
+# Shared links must be #rrggbb, the format the color picker produces
+_HEX_COLOR_RE = re.compile(r'#[0-9a-fA-F]{6}')
+
+def params_from_query(query):
+    """Rebuild the sorted generate_palette parameter tuple and middle color from URL query parameters.
+
+    Values are clamped to the sidebar widgets' ranges (missing ones take the widget
+    defaults), so the palette generated matches what seed_widgets shows.
+    Raises ValueError on non-numeric values or a middle color that isn't #rrggbb.
+    """
+    def number(key, default, low, high, digits=0):
+        value = float(query.get(key, default))
+        if not math.isfinite(value):
+            raise ValueError(f"{key} must be a finite number")
+        value = min(max(round(value, digits), low), high)
+        return int(value) if digits == 0 else value
+    
+    middle_color = query.get("middle")
+    if middle_color is not None and not _HEX_COLOR_RE.fullmatch(middle_color):
+        raise ValueError(f"Invalid middle color: {middle_color!r}")
+    
+    params = {"n": number("n", WIDGET_DEFAULTS["n_colors"], 5, 299)}
+    for name, default_value in LINKED_PARAMS.items():
+        params[name] = number(name, default_value, 0, 360 if name.startswith("h") else 100)
+    for name in ("p1", "p2", "p3", "p4"):
+        params[name] = number(name, WIDGET_DEFAULTS[name], 0.1, 3.0, digits=1)
+    # A colored center takes its hue from the middle color and the UI's fixed center chroma
+    if middle_color is not None:
+        params["h2"] = middle_hue(middle_color)
+    elif "h2" in query:
+        params["h2"] = number("h2", 0, 0, 360, digits=6)
+    else:
+        params["h2"] = None
+    params["c2"] = None if params["h2"] is None else 20
+    params["output_format"] = "rgb_strings"
+    params["use_classic_diverging"] = query.get("classic", "1") == "1"
+    return tuple(sorted(params.items())), middle_color
+
+def seed_widgets(params, middle_color=None):
+    """Set the sidebar widgets' session state to a (validated) generate_palette parameter set"""
+    st.session_state.n_colors = params["n"]
+    for name in LINKED_PARAMS:
+        for key in (f"{name}_value", f"{name}_slider", f"{name}_input"):
+            st.session_state[key] = params[name]
+    for name in ("p1", "p2", "p3", "p4"):
+        st.session_state[name] = params[name]
+    st.session_state.use_neutral_center = params["h2"] is None
+    st.session_state.use_classic_diverging = params["use_classic_diverging"]
+    if middle_color is not None:
+        st.session_state.middle_color = middle_color
+
+@st.cache_resource
+def get_generator():
+    """Shared palette generator, reused across reruns and sessions"""
+    return DivergingPaletteGenerator()
+
+@st.cache_resource
+def get_brand_tester():
+    """Shared brand proximity tester, reused across reruns and sessions"""
+    return BrandColorProximityTester()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_generate(params):
+    """Generate a palette from a sorted tuple of generate_palette keyword arguments"""
+    return get_generator().generate_palette(**dict(params))
+
+# Analysis results are cached on the palette tuple, so tab switches and brand
+# color edits don't redo the color-science work
+@st.cache_data(show_spinner=False)
+def palette_rgb(palette_t):
+    """(N, 3) sRGB array in [0..1] of an rgb() string palette; the strings are parsed only here"""
+    return rgb_strings_to_rgb(list(palette_t))
+
+@st.cache_data(show_spinner=False)
+def cached_cam02ucs(palette_t):
+    """CAM02-UCS coordinates of an rgb() string palette"""
+    return rgb_array_to_cam02ucs(palette_rgb(palette_t))
+
+@st.cache_data(show_spinner=False)
+def cached_curve_data(palette_t):
+    """Lightness, chroma and hue curves of an rgb() string palette"""
+    return get_color_components(cached_cam02ucs(palette_t), use_lab_chroma=True,
+                                rgb=palette_rgb(palette_t))
+
+@st.cache_data(show_spinner=False)
+def cached_proximity(palette_t, brand_t, names_t, threshold):
+    """Brand proximity results for an rgb() string palette, plus the summary table"""
+    results = get_brand_tester().test_brand_proximity(
+        list(palette_t), list(brand_t), palette_format="rgb_strings", threshold=threshold,
+        palette_cam02ucs=cached_cam02ucs(palette_t)
+    )
+    matches = results["closest_matches"]
+    df = pd.DataFrame({
+        'Brand Color': list(brand_t),
+        'Brand Name': list(names_t),
+        'Closest Palette Color': [m["closest_palette_color"] for m in matches],
+        'Palette Index': [m["palette_index"] for m in matches],
+        'ΔE Distance': np.round(results["min_distances"], 3)
+    })
+    return results, df
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def palette_png(palette_t, height=2):
+    """Color bar of an rgb() string palette, rendered once to PNG bytes"""
+    import matplotlib.pyplot as plt
+    fig = create_color_bar_plot(list(palette_t), color_type="rgb", height=height)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100)
+    plt.close(fig)
+    return buf.getvalue()
+
+def curve_panel(df_curves, field, title, y_title, color, markers):
+    """Altair line chart of one curve_data component with dashed index markers"""
+    import altair as alt
+    line = alt.Chart(df_curves, title=title).mark_line(color=color, strokeWidth=2).encode(
+        x=alt.X('index:Q', title='Palette Index'),
+        y=alt.Y(f'{field}:Q', title=y_title, scale=alt.Scale(zero=False))
+    )
+    rules = alt.Chart(markers).mark_rule(strokeDash=[4, 4], opacity=0.7).encode(
+        x='index:Q',
+        color=alt.Color('marker:N', scale=alt.Scale(domain=['Peak', 'Midpoint'], range=['red', 'green']),
+                        legend=alt.Legend(title=None, orient='top-right'))
+    )
+    return line + rules
+
+@st.cache_data(show_spinner=False)
+def cached_delta_e(palette_t):
+    """Adjacent ΔE analysis of an rgb() string palette"""
+    return get_delta_e(list(palette_t), color_type="rgb", show_series=False,
+                       cam02ucs_colors=cached_cam02ucs(palette_t))
+
+@st.cache_data(show_spinner=False)
+def delta_table(palette_t):
+    """Table of every adjacent color pair of an rgb() string palette and its ΔE"""
+    deltas32 = np.asarray(cached_delta_e(palette_t)['deltas'], dtype=np.float32)
+    palette_arr = np.asarray(palette_t)
+    return pd.DataFrame({
+        'Index': np.arange(len(deltas32)),
+        'Color 1': palette_arr[:-1],  # All colors except last
+        'Color 2': palette_arr[1:],   # All colors except first
+        'ΔE': np.round(deltas32, 3)
+    })
+
+def store_palette(palette):
+    """Keep a palette in session state along with its curve and ΔE analyses"""
+    palette_t = tuple(palette)
+    st.session_state.generated_palette = palette
+    # Computed up front so switching views only reads session state
+    st.session_state.curve_data = cached_curve_data(palette_t)
+    st.session_state.delta_results = cached_delta_e(palette_t)
+
+def linked_slider(name, label, max_value, help):
+    """Slider with a number input beside it; the pair is reconciled on form submit"""
+    col1, col2 = params_form.columns([3, 1])
+    with col1:
+        st.slider(label, 0, max_value, help=help, key=f"{name}_slider")
+    with col2:
+        st.number_input(label, min_value=0, max_value=max_value, label_visibility="collapsed", key=f"{name}_input")
+    return st.session_state[f"{name}_value"]
+
+# Restore the palette from URL parameters after a refresh or when opening a shared link.
+# This runs before the sidebar is drawn so the widgets can be seeded with the same values
+if st.session_state.generated_palette is None and "n" in st.query_params:
+    try:
+        restored_params, restored_middle = params_from_query(st.query_params.to_dict())
+        seed_widgets(dict(restored_params), restored_middle)
+        store_palette(_cached_generate(restored_params))
+        # Rewrite the URL with the clamped values actually used
+        st.query_params.from_dict(params_to_query(dict(restored_params), restored_middle))
+    except Exception as e:
+        st.sidebar.error(f"❌ Could not restore palette from URL: {str(e)}")
+
 # Sidebar for parameters
 st.sidebar.header("🎛️ Palette Parameters")
 
+# Parameter widgets live in a form so edits only rerun the app on submit
+params_form = st.sidebar.form("params")
+
 # Basic parameters
-st.sidebar.subheader("Basic Settings")
-n_colors = st.sidebar.number_input("Number of colors", min_value=5, max_value=299, value=199, step=2, help="Odd numbers recommended for clear midpoint")
+params_form.subheader("Basic Settings")
+n_colors = params_form.number_input("Number of colors", min_value=5, max_value=299, step=2, help="Odd numbers recommended for clear midpoint", key="n_colors")
 
 # Hue parameters
-st.sidebar.subheader("🌈 Hue Settings")
-
-# Left hue with slider and number input - two-way binding
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    h1_slider = st.slider("Left hue (°)", 0, 360, st.session_state.h1_value, help="Hue for left arm (blue = 255)", key="h1_slider")
-with col2:
-    h1_input = st.number_input("", min_value=0, max_value=360, value=st.session_state.h1_value, label_visibility="collapsed", key="h1_input")
-
-# Update session state with whichever changed
-if h1_slider != st.session_state.h1_value:
-    st.session_state.h1_value = h1_slider
-elif h1_input != st.session_state.h1_value:
-    st.session_state.h1_value = h1_input
-h1 = st.session_state.h1_value
+params_form.subheader("🌈 Hue Settings")
 
-# Right hue with slider and number input - two-way binding
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    h3_slider = st.slider("Right hue (°)", 0, 360, st.session_state.h3_value, help="Hue for right arm (red = 10)", key="h3_slider")
-with col2:
-    h3_input = st.number_input("", min_value=0, max_value=360, value=st.session_state.h3_value, label_visibility="collapsed", key="h3_input")
+h1 = linked_slider("h1", "Left hue (°)", 360, help="Hue for left arm (blue = 255)")
 
-# Update session state with whichever changed
-if h3_slider != st.session_state.h3_value:
-    st.session_state.h3_value = h3_slider
-elif h3_input != st.session_state.h3_value:
-    st.session_state.h3_value = h3_input
-h3 = st.session_state.h3_value
+h3 = linked_slider("h3", "Right hue (°)", 360, help="Hue for right arm (red = 10)")
 
 # Middle hue with color picker and RGB input
-st.sidebar.markdown("**Middle hue/color**")
-use_neutral_center = st.sidebar.checkbox("Use neutral center", value=True, help="Check to use gray center, uncheck for colored center")
-use_classic_diverging = st.sidebar.checkbox("Classic diverging (HCL Wizard style)", value=True, help="Use classic diverging_hcl for constant hues per arm (like HCL Wizard)")
+params_form.markdown("**Middle hue/color**")
+use_neutral_center = params_form.checkbox("Use neutral center", help="Check to use gray center, uncheck for colored center", key="use_neutral_center")
+use_classic_diverging = params_form.checkbox("Classic diverging (HCL Wizard style)", help="Use classic diverging_hcl for constant hues per arm (like HCL Wizard)", key="use_classic_diverging")
 
 # Focus on parameter-based approach - waypoints feature disabled for now
 use_brand_waypoints = False
 
+# Form widgets only take effect on submit, so the middle color inputs are always
+# shown and simply ignored while "Use neutral center" is checked
+col1, col2 = params_form.columns(2)
+with col1:
+    middle_color_hex = st.color_picker("Middle color", help="Color for center (used when 'Use neutral center' is unchecked)", key="middle_color")
+    middle_rgb = hex_to_rgb(middle_color_hex)
+
+with col2:
+    rgb_input = st.text_input("RGB input", f"rgb({middle_rgb[0]}, {middle_rgb[1]}, {middle_rgb[2]})", 
+                            help="Format: rgb(r,g,b)")
+    parsed_rgb = parse_rgb_input(rgb_input)
+    if parsed_rgb and parsed_rgb != middle_rgb:
+        middle_rgb = parsed_rgb
+        middle_color_hex = rgb_to_hex(middle_rgb)
+
 if not use_neutral_center:
-    col1, col2 = st.sidebar.columns(2)
-    with col1:
-        middle_color_hex = st.color_picker("Middle color", "#808080", help="Color for center")
-        middle_rgb = hex_to_rgb(middle_color_hex)
-    
-    with col2:
-        rgb_input = st.text_input("RGB input", f"rgb({middle_rgb[0]}, {middle_rgb[1]}, {middle_rgb[2]})", 
-                                help="Format: rgb(r,g,b)")
-        parsed_rgb = parse_rgb_input(rgb_input)
-        if parsed_rgb and parsed_rgb != middle_rgb:
-            middle_rgb = parsed_rgb
-            middle_color_hex = rgb_to_hex(middle_rgb)
-    
     # Convert RGB to approximate hue for colorspace
-    from colorspacious import cspace_convert
-    rgb_norm = tuple(x/255.0 for x in middle_rgb)
     try:
-        lab = cspace_convert(rgb_norm, "sRGB1", "CIELab")
-        h2 = np.degrees(np.arctan2(lab[2], lab[1])) % 360  # Hue from a*, b*
+        h2 = middle_hue(middle_color_hex)
     except:
         h2 = int((h1 + h3) / 2)  # Fallback
 else:
@@ -137,102 +342,39 @@ else:
     middle_rgb = (128, 128, 128)  # Gray
 
 # Lightness parameters with sliders and number inputs
-st.sidebar.subheader("💡 Lightness Settings")
+params_form.subheader("💡 Lightness Settings")
 
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    l1_slider = st.slider("Left lightness", 0, 100, st.session_state.l1_value, help="Lightness at left end", key="l1_slider")
-with col2:
-    l1_input = st.number_input("", min_value=0, max_value=100, value=st.session_state.l1_value, label_visibility="collapsed", key="l1_input")
-if l1_slider != st.session_state.l1_value:
-    st.session_state.l1_value = l1_slider
-elif l1_input != st.session_state.l1_value:
-    st.session_state.l1_value = l1_input
-l1 = st.session_state.l1_value
-
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    l2_slider = st.slider("Middle lightness", 0, 100, st.session_state.l2_value, help="Peak lightness at center", key="l2_slider")
-with col2:
-    l2_input = st.number_input("", min_value=0, max_value=100, value=st.session_state.l2_value, label_visibility="collapsed", key="l2_input")
-if l2_slider != st.session_state.l2_value:
-    st.session_state.l2_value = l2_slider
-elif l2_input != st.session_state.l2_value:
-    st.session_state.l2_value = l2_input
-l2 = st.session_state.l2_value
-
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    l3_slider = st.slider("Right lightness", 0, 100, st.session_state.l3_value, help="Lightness at right end", key="l3_slider")
-with col2:
-    l3_input = st.number_input("", min_value=0, max_value=100, value=st.session_state.l3_value, label_visibility="collapsed", key="l3_input")
-if l3_slider != st.session_state.l3_value:
-    st.session_state.l3_value = l3_slider
-elif l3_input != st.session_state.l3_value:
-    st.session_state.l3_value = l3_input
-l3 = st.session_state.l3_value
+l1 = linked_slider("l1", "Left lightness", 100, help="Lightness at left end")
+
+l2 = linked_slider("l2", "Middle lightness", 100, help="Peak lightness at center")
+
+l3 = linked_slider("l3", "Right lightness", 100, help="Lightness at right end")
 
 # Chroma parameters with sliders and number inputs
-st.sidebar.subheader("🌈 Chroma Settings")
+params_form.subheader("🌈 Chroma Settings")
 
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    c1_slider = st.slider("Left chroma", 0, 100, st.session_state.c1_value, help="Chroma at left end", key="c1_slider")
-with col2:
-    c1_input = st.number_input("", min_value=0, max_value=100, value=st.session_state.c1_value, label_visibility="collapsed", key="c1_input")
-if c1_slider != st.session_state.c1_value:
-    st.session_state.c1_value = c1_slider
-elif c1_input != st.session_state.c1_value:
-    st.session_state.c1_value = c1_input
-c1 = st.session_state.c1_value
-
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    c3_slider = st.slider("Right chroma", 0, 100, st.session_state.c3_value, help="Chroma at right end", key="c3_slider")
-with col2:
-    c3_input = st.number_input("", min_value=0, max_value=100, value=st.session_state.c3_value, label_visibility="collapsed", key="c3_input")
-if c3_slider != st.session_state.c3_value:
-    st.session_state.c3_value = c3_slider
-elif c3_input != st.session_state.c3_value:
-    st.session_state.c3_value = c3_input
-c3 = st.session_state.c3_value
-
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    cmax1_slider = st.slider("Left chroma peak", 0, 100, st.session_state.cmax1_value, help="Maximum chroma for left arm", key="cmax1_slider")
-with col2:
-    cmax1_input = st.number_input("", min_value=0, max_value=100, value=st.session_state.cmax1_value, label_visibility="collapsed", key="cmax1_input")
-if cmax1_slider != st.session_state.cmax1_value:
-    st.session_state.cmax1_value = cmax1_slider
-elif cmax1_input != st.session_state.cmax1_value:
-    st.session_state.cmax1_value = cmax1_input
-cmax1 = st.session_state.cmax1_value
-
-col1, col2 = st.sidebar.columns([3, 1])
-with col1:
-    cmax2_slider = st.slider("Right chroma peak", 0, 100, st.session_state.cmax2_value, help="Maximum chroma for right arm", key="cmax2_slider")
-with col2:
-    cmax2_input = st.number_input("", min_value=0, max_value=100, value=st.session_state.cmax2_value, label_visibility="collapsed", key="cmax2_input")
-if cmax2_slider != st.session_state.cmax2_value:
-    st.session_state.cmax2_value = cmax2_slider
-elif cmax2_input != st.session_state.cmax2_value:
-    st.session_state.cmax2_value = cmax2_input
-cmax2 = st.session_state.cmax2_value
+c1 = linked_slider("c1", "Left chroma", 100, help="Chroma at left end")
+
+c3 = linked_slider("c3", "Right chroma", 100, help="Chroma at right end")
+
+cmax1 = linked_slider("cmax1", "Left chroma peak", 100, help="Maximum chroma for left arm")
+
+cmax2 = linked_slider("cmax2", "Right chroma peak", 100, help="Maximum chroma for right arm")
 
 # Power transformation parameters
-st.sidebar.subheader("⚡ Power Transformations")
-st.sidebar.markdown("*Controls curve shapes: < 1.0 = faster change, > 1.0 = slower change*")
+params_form.subheader("⚡ Power Transformations")
+params_form.markdown("*Controls curve shapes: < 1.0 = faster change, > 1.0 = slower change*")
 
-col1, col2 = st.sidebar.columns(2)
+col1, col2 = params_form.columns(2)
 with col1:
     st.markdown("**Left Arm**")
-    p1 = st.slider("Left chroma power", 0.1, 3.0, 1.3, 0.1, help="Controls chroma buildup speed")
-    p2 = st.slider("Left lightness power", 0.1, 3.0, 1.3, 0.1, help="Controls hat width (< 1 = narrow)")
+    p1 = st.slider("Left chroma power", 0.1, 3.0, step=0.1, help="Controls chroma buildup speed", key="p1")
+    p2 = st.slider("Left lightness power", 0.1, 3.0, step=0.1, help="Controls hat width (< 1 = narrow)", key="p2")
 
 with col2:
     st.markdown("**Right Arm**")
-    p3 = st.slider("Right chroma power", 0.1, 3.0, 1.3, 0.1, help="Controls chroma buildup speed")
-    p4 = st.slider("Right lightness power", 0.1, 3.0, 1.3, 0.1, help="Controls hat width (< 1 = narrow)")
+    p3 = st.slider("Right chroma power", 0.1, 3.0, step=0.1, help="Controls chroma buildup speed", key="p3")
+    p4 = st.slider("Right lightness power", 0.1, 3.0, step=0.1, help="Controls hat width (< 1 = narrow)", key="p4")
 
 # Brand colors - store as RGB values
 st.sidebar.subheader("🏷️ Brand Colors")
@@ -245,7 +387,7 @@ brand_color_right_rgb = hex_to_rgb(brand_color_right_hex)
 
 # Brand color analyzer
 if st.sidebar.button("🔍 Analyze Brand Colors", help="Extract optimal parameters from your brand colors"):
-    generator = DivergingPaletteGenerator()
+    generator = get_generator()
     
     h1, c1, l1 = generator.hex_to_hcl(brand_color_left_hex)
     h3, c3, l3 = generator.hex_to_hcl(brand_color_right_hex)
@@ -266,17 +408,15 @@ if st.sidebar.button("🔍 Analyze Brand Colors", help="Extract optimal paramete
     st.sidebar.markdown(f"• Power: **{suggested_power}**")
 
 # Generate palette button
-if st.sidebar.button("🎨 Generate Palette", type="primary"):
+if params_form.form_submit_button("🎨 Generate Palette", type="primary", on_click=sync_linked_params):
     with st.spinner("Generating palette..."):
         try:
-            generator = DivergingPaletteGenerator()
-            
             # Use parameter-based mode (waypoints disabled)
             # Adjust parameters based on neutral center setting
             h2_param = None if use_neutral_center else h2
             c2_param = None if use_neutral_center else 20  # Small chroma for colored center
             
-            palette = generator.generate_palette(
+            params = dict(
                 n=n_colors,
                 h1=h1, h2=h2_param, h3=h3,
                 c1=c1, c2=c2_param, c3=c3,
@@ -286,8 +426,12 @@ if st.sidebar.button("🎨 Generate Palette", type="primary"):
                 output_format="rgb_strings",  # Work with RGB as requested
                 use_classic_diverging=use_classic_diverging
             )
+            # Identical parameter sets are served from the cache
+            palette = _cached_generate(tuple(sorted(params.items())))
             
-            st.session_state.generated_palette = palette
+            store_palette(palette)
+            # Keep the parameters in the URL so a refresh or shared link restores the palette
+            st.query_params.from_dict(params_to_query(params, None if use_neutral_center else middle_color_hex))
             st.sidebar.success(f"✅ Generated {len(palette)} colors!")
             
             # Check if chroma was limited by sRGB gamut
@@ -299,19 +443,32 @@ if st.sidebar.button("🎨 Generate Palette", type="primary"):
         except Exception as e:
             st.sidebar.error(f"❌ Error generating palette: {str(e)}")
 
+def swatch_cell(title, color, caption):
+    """HTML cell with a title, a color swatch and a caption"""
+    return (f'<div style="flex: 1;"><b>{title}</b>'
+            f'<div style="width: 80px; height: 60px; background-color: {color}; border: 1px solid #ccc; border-radius: 4px; margin: 4px 0;"></div>'
+            f'<small style="opacity: 0.6;">{caption}</small></div>')
+
+def value_cell(title, value):
+    """HTML cell with a title and a large centered value"""
+    return (f'<div style="flex: 1;"><b>{title}</b>'
+            f"<div style='font-size: 24px; font-weight: bold; text-align: center; padding: 20px;'>{value}</div></div>")
+
 # Display results if palette is generated
 if st.session_state.generated_palette is not None:
     palette = st.session_state.generated_palette
+    palette_key = tuple(palette)
     
     # Main content area with tabs - Curve Analysis moved to 2nd position
-    tab1, tab2, tab3, tab4 = st.tabs(["🎨 Palette & Analysis", "📈 Curve Analysis", "📊 Delta E Analysis", "🏷️ Brand Proximity"])
+    # A radio instead of st.tabs, so only the selected view runs its analysis on each rerun
+    tab_names = ["🎨 Palette & Analysis", "📈 Curve Analysis", "📊 Delta E Analysis", "🏷️ Brand Proximity"]
+    active_tab = st.radio("View", tab_names, key="active_tab", horizontal=True, label_visibility="collapsed")
     
-    with tab1:
+    if active_tab == tab_names[0]:
         st.header("Color Palette Visualization")
         
         # Create color bar
-        fig_colorbar = create_color_bar_plot(palette, color_type="rgb", height=2)
-        st.pyplot(fig_colorbar)
+        st.image(palette_png(palette_key), width="stretch")
         
         # Display basic info
         col1, col2, col3 = st.columns(3)
@@ -326,123 +483,102 @@ if st.session_state.generated_palette is not None:
         st.subheader("Sample Colors")
         col1, col2, col3 = st.columns(3)
         
+        # One code block per column instead of one message per color
         with col1:
             st.markdown("**First 5 colors:**")
-            for i, color in enumerate(palette[:5]):
-                st.markdown(f"`{i:3d}: {color}`")
+            st.code(sample_lines(palette[:5], 0), language=None)
                 
         with col2:
             st.markdown("**Middle 5 colors:**")
             mid_idx = len(palette) // 2
-            for i, color in enumerate(palette[mid_idx-2:mid_idx+3], mid_idx-2):
-                st.markdown(f"`{i:3d}: {color}`")
+            st.code(sample_lines(palette[mid_idx-2:mid_idx+3], mid_idx-2), language=None)
                 
         with col3:
             st.markdown("**Last 5 colors:**")
-            for i, color in enumerate(palette[-5:], len(palette)-5):
-                st.markdown(f"`{i:3d}: {color}`")
+            st.code(sample_lines(palette[-5:], len(palette)-5), language=None)
         
-        # Export options
+        # Export options; downloading doesn't need to rerun the app
         st.subheader("Export Options")
         col1, col2 = st.columns(2)
         
         with col1:
             # RGB strings export (already in this format)
-            rgb_text = str(palette)
+            # One color per line; rgb() strings contain commas themselves
+            rgb_text = "\n".join(palette)
             st.download_button(
                 "🎨 Download RGB Strings",
                 rgb_text,
-                f"palette_{n_colors}_colors_rgb.txt",
-                "text/plain"
+                f"palette_{len(palette)}_colors_rgb.txt",
+                "text/plain",
+                on_click="ignore"
             )
             
         with col2:
             # Convert to hex for export
-            hex_palette = []
-            for color in palette:
-                match = re.match(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color)
-                if match:
-                    r, g, b = map(int, match.groups())
-                    hex_palette.append(f"#{r:02x}{g:02x}{b:02x}")
+            hex_palette = rgb_strings_to_hex(palette)
             
-            hex_text = str(hex_palette)
+            hex_text = ",".join(hex_palette)
             st.download_button(
                 "📝 Download Hex Colors",
                 hex_text,
-                f"palette_{n_colors}_colors_hex.txt",
-                "text/plain"
+                f"palette_{len(palette)}_colors_hex.txt",
+                "text/plain",
+                on_click="ignore"
             )
     
-    with tab2:
+    if active_tab == tab_names[1]:
         st.header("📈 Lightness, Chroma & Hue Analysis")
         
-        # Get curve data
-        cam02ucs_colors = convert_list_to_cam02ucs(palette, color_type="rgb")
-        
-        # Create the visualization with smaller charts in one row
-        from analysis_functions import visualize_color_components
-        curve_data = visualize_color_components(cam02ucs_colors, show_chroma_hue=True, return_data=True, use_lab_chroma=True)
-        
-        # Create compact 3-chart layout
-        fig, axes = plt.subplots(1, 3, figsize=(15, 4))
-        x = range(len(curve_data['lightness']))
-        
-        # Lightness plot
-        axes[0].plot(x, curve_data['lightness'], 'b-', linewidth=2)
-        peak_lightness_idx = np.argmax(curve_data['lightness'])
-        midpoint_idx = len(curve_data['lightness']) // 2
-        axes[0].axvline(peak_lightness_idx, color='r', linestyle='--', alpha=0.7, label='Peak')
-        axes[0].axvline(midpoint_idx, color='g', linestyle='--', alpha=0.7, label='Midpoint')
-        axes[0].set_title("Lightness (J')")
-        axes[0].set_ylabel("J'")
-        axes[0].grid(True, alpha=0.3)
-        axes[0].legend()
-        
-        # Chroma plot
-        axes[1].plot(x, curve_data['chroma'], 'r-', linewidth=2)
-        axes[1].axvline(midpoint_idx, color='g', linestyle='--', alpha=0.7, label='Midpoint')
-        axes[1].set_title("Chroma")
-        axes[1].set_ylabel("Chroma")
-        axes[1].grid(True, alpha=0.3)
-        axes[1].legend()
-        
-        # Hue plot
-        axes[2].plot(x, curve_data['hue'], 'purple', linewidth=2)
-        axes[2].axvline(midpoint_idx, color='g', linestyle='--', alpha=0.7, label='Midpoint')
-        axes[2].set_title("Hue Angle")
-        axes[2].set_ylabel("Hue (°)")
-        axes[2].set_xlabel("Palette Index")
-        axes[2].grid(True, alpha=0.3)
-        axes[2].legend()
-        
-        plt.tight_layout()
-        st.pyplot(fig)
+        # Curve data was computed when the palette was generated
+        curve_data = st.session_state.curve_data
+        
+        L = curve_data['lightness']
+        # Peak and midpoint are found once and reused for the metrics and monotonicity check
+        peak_lightness_idx = int(L.argmax())
+        midpoint_idx = len(L) // 2
+
+        # Compact 3-chart layout, drawn client-side by Vega-Lite
+        df_curves = pd.DataFrame({
+            'index': np.arange(len(L)),
+            'lightness': L,
+            'chroma': curve_data['chroma'],
+            'hue': curve_data['hue']
+        })
+        midpoint = pd.DataFrame({'index': [midpoint_idx], 'marker': ['Midpoint']})
+        peak_and_midpoint = pd.DataFrame({'index': [peak_lightness_idx, midpoint_idx], 'marker': ['Peak', 'Midpoint']})
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.altair_chart(curve_panel(df_curves, 'lightness', "Lightness (J')", "J'", 'blue', peak_and_midpoint), width="stretch")
+        with col2:
+            st.altair_chart(curve_panel(df_curves, 'chroma', "Chroma", "Chroma", 'red', midpoint), width="stretch")
+        with col3:
+            st.altair_chart(curve_panel(df_curves, 'hue', "Hue Angle", "Hue (°)", 'purple', midpoint), width="stretch")
         
         # Curve analysis metrics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            lightness_range = max(curve_data['lightness']) - min(curve_data['lightness'])
+            lightness_range = np.ptp(L)
             st.metric("Lightness Range", f"{lightness_range:.1f}")
             
         with col2:
-            chroma_range = max(curve_data['chroma']) - min(curve_data['chroma'])
+            chroma_range = np.ptp(curve_data['chroma'])
             st.metric("Chroma Range", f"{chroma_range:.1f}")
             
         with col3:
-            hat_width_ratio = abs(peak_lightness_idx - midpoint_idx) / (len(curve_data['lightness']) / 2)
+            hat_width_ratio = abs(peak_lightness_idx - midpoint_idx) / (len(L) / 2)
             st.metric("Hat Width Ratio", f"{hat_width_ratio:.3f}")
             
         with col4:
-            max_lightness = max(curve_data['lightness'])
+            max_lightness = L[peak_lightness_idx]
             st.metric("Peak Lightness", f"{max_lightness:.1f}")
         
         # Monotonicity check
         st.subheader("Monotonicity Analysis")
         
-        peak_idx = np.argmax(curve_data['lightness'])
-        left_monotonic = all(curve_data['lightness'][i] <= curve_data['lightness'][i+1] for i in range(peak_idx))
-        right_monotonic = all(curve_data['lightness'][i] >= curve_data['lightness'][i+1] for i in range(peak_idx, len(curve_data['lightness'])-1))
+        left_monotonic = bool((np.diff(L[:peak_lightness_idx+1]) >= 0).all())
+        right_monotonic = bool((np.diff(L[peak_lightness_idx:]) <= 0).all())
         
         col1, col2 = st.columns(2)
         with col1:
@@ -450,12 +586,12 @@ if st.session_state.generated_palette is not None:
         with col2:
             st.metric("Right Arm Monotonic", "✅ Yes" if right_monotonic else "❌ No")
     
-    with tab3:
+    if active_tab == tab_names[2]:
         st.header("📊 Delta E Analysis")
+        import altair as alt
         
-        # Run delta E analysis
-        with st.spinner("Analyzing color differences..."):
-            delta_results = get_delta_e(palette, color_type="rgb", show_series=False)
+        # Computed when the palette was generated
+        delta_results = st.session_state.delta_results
         
         # Display metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -468,46 +604,44 @@ if st.session_state.generated_palette is not None:
         with col4:
             st.metric("Total Adjacent Pairs", len(delta_results['deltas']))
         
-        # Delta E distribution plot
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
-        
-        # Bar plot of deltas
-        x = range(len(delta_results['deltas']))
-        ax1.bar(x, delta_results['deltas'], alpha=0.7)
-        ax1.axhline(delta_results['mean_dE'], color='r', linestyle='--', label=f'Mean = {delta_results["mean_dE"]:.3f}')
-        ax1.set_title('Adjacent ΔE Values')
-        ax1.set_xlabel('Color Pair Index')
-        ax1.set_ylabel('ΔE Value')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # Histogram of deltas
-        ax2.hist(delta_results['deltas'], bins=20, alpha=0.7, edgecolor='black')
-        ax2.axvline(delta_results['mean_dE'], color='r', linestyle='--', label=f'Mean = {delta_results["mean_dE"]:.3f}')
-        ax2.set_title('ΔE Distribution')
-        ax2.set_xlabel('ΔE Value')
-        ax2.set_ylabel('Frequency')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        st.pyplot(fig)
+        # Deltas are only shown to 3 decimals, so float32 is plenty for plots and tables
+        deltas32 = np.asarray(delta_results['deltas'], dtype=np.float32)
+        
+        # Delta E distribution plot, drawn client-side by Vega-Lite instead of rasterized here
+        mean_dE = float(delta_results['mean_dE'])
+        df_deltas = pd.DataFrame({'pair': np.arange(len(deltas32)), 'dE': deltas32})
+        mean_rule = alt.Chart(pd.DataFrame({'mean': [mean_dE]}))
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            # Bar plot of deltas
+            bars = alt.Chart(df_deltas, title='Adjacent ΔE Values').mark_bar(opacity=0.7).encode(
+                x=alt.X('pair:Q', title='Color Pair Index'),
+                y=alt.Y('dE:Q', title='ΔE Value')
+            )
+            mean_line = mean_rule.mark_rule(color='red', strokeDash=[4, 4]).encode(y='mean:Q')
+            st.altair_chart(bars + mean_line, width="stretch")
+        
+        with col2:
+            # Histogram of deltas
+            hist = alt.Chart(df_deltas, title='ΔE Distribution').mark_bar(opacity=0.7, stroke='black').encode(
+                x=alt.X('dE:Q', bin=alt.Bin(maxbins=20), title='ΔE Value'),
+                y=alt.Y('count()', title='Frequency')
+            )
+            mean_line = mean_rule.mark_rule(color='red', strokeDash=[4, 4]).encode(x='mean:Q')
+            st.altair_chart(hist + mean_line, width="stretch")
+        st.caption(f"Red dashed line: mean ΔE = {mean_dE:.3f}")
         
         # Detailed delta E table - show ALL values as requested
         st.subheader("All ΔE Values")
         
-        # Create full dataframe with all adjacent pairs
-        df_all = pd.DataFrame({
-            'Index': range(len(delta_results['deltas'])),
-            'Color 1': palette[:-1],  # All colors except last
-            'Color 2': palette[1:],   # All colors except first
-            'ΔE': [round(d, 3) for d in delta_results['deltas']]
-        })
+        # Full dataframe with all adjacent pairs, built once per palette
+        df_all = delta_table(palette_key)
         
         # Display with pagination-like scrolling
-        st.dataframe(df_all, use_container_width=True, height=400)
+        st.dataframe(df_all, width="stretch", height=400)
     
-    with tab4:
+    if active_tab == tab_names[3]:
         st.header("🏷️ Brand Color Proximity Analysis")
         
         # Run brand proximity analysis using hex colors for consistency
@@ -515,54 +649,38 @@ if st.session_state.generated_palette is not None:
         brand_colors = [brand_color_left_hex, brand_color_right_hex]
         brand_names = ["Left Brand Color", "Right Brand Color"]
         
-        tester = BrandColorProximityTester()
-        
         with st.spinner("Analyzing brand color proximity..."):
-            proximity_results = tester.test_brand_proximity(
-                palette, brand_colors, palette_format="rgb_strings", threshold=15.0
+            proximity_results, df_proximity = cached_proximity(
+                palette_key, tuple(brand_colors), tuple(brand_names), 15.0
             )
         
         # Display results in compact layout
         st.subheader("Proximity Results")
         
+        # Convert all matched RGB strings to hex for display in one pass
+        match_hexes = rgb_strings_to_hex([m["closest_palette_color"] for m in proximity_results["closest_matches"]])
+        
         for i, match in enumerate(proximity_results["closest_matches"]):
             # Get RGB values for display
             brand_rgb = hex_to_rgb(brand_colors[i])
             brand_rgb_str = f"rgb({brand_rgb[0]}, {brand_rgb[1]}, {brand_rgb[2]})"
             
-            # Convert match RGB string to hex for display
-            match_rgb = re.match(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', match["closest_palette_color"])
-            if match_rgb:
-                r, g, b = map(int, match_rgb.groups())
-                match_hex = f"#{r:02x}{g:02x}{b:02x}"
-                match_rgb_str = match["closest_palette_color"]
+            match_hex = match_hexes[i]
+            match_rgb_str = match["closest_palette_color"]
             
             # Create row layout: Brand Color | Closest Match | ΔE Distance | Palette Index | Similarity
-            col1, col2, col3, col4, col5 = st.columns([2, 2, 2, 2, 3])
+            # The first four cells are one HTML block rather than a dozen separate elements
+            col_row, col5 = st.columns([8, 3])
             
-            with col1:
-                st.markdown(f"**{brand_names[i]}**")
-                # Brand color swatch
-                st.markdown(f'<div style="width: 80px; height: 60px; background-color: {brand_colors[i]}; border: 1px solid #ccc; border-radius: 4px; margin-bottom: 4px;"></div>', 
-                           unsafe_allow_html=True)
-                st.caption(brand_rgb_str)  # Show RGB value, not hex
-            
-            with col2:
-                st.markdown("**Closest Match**")
-                # Closest match swatch right next to brand color
-                st.markdown(f'<div style="width: 80px; height: 60px; background-color: {match_hex}; border: 1px solid #ccc; border-radius: 4px; margin-bottom: 4px;"></div>', 
-                           unsafe_allow_html=True)
-                st.caption(match_rgb_str)  # Show RGB value
-            
-            with col3:
-                st.markdown("**ΔE Distance**")
-                st.markdown(f"<div style='font-size: 24px; font-weight: bold; text-align: center; padding: 20px;'>{match['distance']:.3f}</div>", 
-                           unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown("**Palette Index**")
-                st.markdown(f"<div style='font-size: 24px; font-weight: bold; text-align: center; padding: 20px;'>{match['palette_index']}</div>", 
-                           unsafe_allow_html=True)
+            with col_row:
+                st.html(
+                    '<div style="display: flex;">'
+                    + swatch_cell(brand_names[i], brand_colors[i], brand_rgb_str)
+                    + swatch_cell("Closest Match", match_hex, match_rgb_str)
+                    + value_cell("ΔE Distance", f"{match['distance']:.3f}")
+                    + value_cell("Palette Index", match['palette_index'])
+                    + '</div>'
+                )
             
             with col5:
                 st.markdown("**Similarity**")
@@ -586,16 +704,9 @@ if st.session_state.generated_palette is not None:
         else:
             st.success("✅ No proximity conflicts detected (ΔE > 15)")
         
-        # Detailed proximity table
-        st.subheader("All Proximity Values")
-        df_proximity = pd.DataFrame({
-            'Brand Color': brand_colors,
-            'Brand Name': brand_names,
-            'Closest Palette Color': [match["closest_palette_color"] for match in proximity_results["closest_matches"]],
-            'Palette Index': [match["palette_index"] for match in proximity_results["closest_matches"]],
-            'ΔE Distance': [round(match["distance"], 3) for match in proximity_results["closest_matches"]]
-        })
-        st.dataframe(df_proximity, use_container_width=True)
+        # Detailed proximity table; collapsed so the grid is only drawn when opened
+        with st.expander("All Proximity Values", expanded=False):
+            st.dataframe(df_proximity, width="stretch")
 
 else:
     st.info("👈 Adjust parameters in the sidebar and click 'Generate Palette' to get started!")